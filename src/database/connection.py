@@ -13,15 +13,22 @@ from typing import Optional, Dict, Any, List, Callable
 from contextlib import contextmanager
 from pathlib import Path
 import os
+import uuid
 
 logger = logging.getLogger(__name__)
 
 class DatabaseConnectionManager:
     """Manages SQLite database connections with pooling and error handling."""
     
+    # Compiled statements kept per connection; the data access layer uses a
+    # fixed set of SQL strings, so repeated calls skip re-parsing
+    STATEMENT_CACHE_SIZE = 256
+    
     def __init__(self, database_path: str = "data/quiz.db", 
                  max_connections: int = 10, 
-                 connection_timeout: int = 30):
+                 connection_timeout: int = 30,
+                 in_memory: bool = False,
+                 test_mode: bool = False):
         """
         Initialize the database connection manager.
         
@@ -29,16 +36,27 @@ class DatabaseConnectionManager:
             database_path: Path to SQLite database file
             max_connections: Maximum number of concurrent connections
             connection_timeout: Connection timeout in seconds
+            in_memory: Keep the database in a private shared-cache memory
+                database instead of a file (database_path is ignored)
+            test_mode: Trade durability for speed (in-memory journal, no fsync);
+                only for throwaway test databases
         """
+        self.in_memory = in_memory
+        self.test_mode = test_mode
+        if in_memory:
+            database_path = f"file:quizdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
         self.database_path = database_path
         self.max_connections = max_connections
         self.connection_timeout = connection_timeout
         self._connections: List[sqlite3.Connection] = []
         self._lock = threading.Lock()
         self._initialized = False
+        # Memory databases are freed with their last connection, so one is held open
+        self._keeper: Optional[sqlite3.Connection] = None
         
         # Ensure database directory exists
-        os.makedirs(os.path.dirname(database_path), exist_ok=True)
+        if not in_memory:
+            os.makedirs(os.path.dirname(database_path), exist_ok=True)
         
         logger.info(f"Database connection manager initialized for {database_path}")
     
@@ -54,6 +72,9 @@ class DatabaseConnectionManager:
                 if self._initialized:
                     return True
                 
+                if self.in_memory and self._keeper is None:
+                    self._keeper = self._create_connection()
+                
                 # Create initial connections
                 for _ in range(min(3, self.max_connections)):
                     conn = self._create_connection()
@@ -74,14 +95,21 @@ class DatabaseConnectionManager:
             conn = sqlite3.connect(
                 self.database_path,
                 timeout=self.connection_timeout,
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=self.STATEMENT_CACHE_SIZE,
+                uri=self.in_memory
             )
             
             # Configure connection
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.execute("PRAGMA synchronous = NORMAL")
+            if self.test_mode:
+                # Commits skip fsync and the rollback journal never touches disk
+                conn.execute("PRAGMA journal_mode = MEMORY")
+                conn.execute("PRAGMA synchronous = OFF")
+            else:
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
             conn.execute("PRAGMA cache_size = 10000")
             conn.execute("PRAGMA temp_store = MEMORY")
             
@@ -303,9 +331,51 @@ class DatabaseConnectionManager:
                 except Exception as e:
                     logger.error(f"Error closing connection: {e}")
             self._connections.clear()
+            if self._keeper is not None:
+                self._keeper.close()
+                self._keeper = None
             self._initialized = False
             logger.info("All database connections closed")
     
+    def create_snapshot(self) -> Optional[sqlite3.Connection]:
+        """
+        Copy the whole database into a private in-memory connection.
+    
+        Uses the SQLite online backup API, so only pages are copied and no
+        SQL is replayed. Pair with restore_snapshot to reset test databases.
+    
+        Returns:
+            In-memory connection holding the copy, or None if failed
+        """
+        try:
+            snapshot = sqlite3.connect(":memory:", check_same_thread=False)
+            with self.get_connection_context() as conn:
+                conn.backup(snapshot)
+            return snapshot
+    
+        except Exception as e:
+            logger.error(f"Failed to snapshot database: {e}")
+            return None
+    
+    def restore_snapshot(self, snapshot: sqlite3.Connection) -> bool:
+        """
+        Overwrite the database with a snapshot from create_snapshot.
+    
+        Args:
+            snapshot: Connection returned by create_snapshot
+    
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self.get_connection_context() as conn:
+                snapshot.backup(conn)
+            return True
+    
+        except Exception as e:
+            logger.error(f"Failed to restore database snapshot: {e}")
+            return False
+    
     def vacuum_database(self) -> bool:
         """
         Vacuum the database to reclaim space and optimize performance.
@@ -17,6 +17,13 @@ logger = logging.getLogger(__name__)
 class QuestionDataAccess:
     """Data access layer for questions in SQLite."""
     
+    INSERT_QUESTION_QUERY = """
+        INSERT INTO questions 
+        (id, question_text, question_type, answers, tags, usage_count, 
+         quality_score, created_at, last_modified, created_by, version)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
     def __init__(self, db_manager: DatabaseConnectionManager):
         """Initialize question data access."""
         self.db_manager = db_manager
@@ -32,28 +39,9 @@ class QuestionDataAccess:
             Question ID if successful, None otherwise
         """
         try:
-            query = """
-                INSERT INTO questions 
-                (id, question_text, question_type, answers, tags, usage_count, 
-                 quality_score, created_at, last_modified, created_by, version)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+            params = self._question_insert_params(question_data)
             
-            params = (
-                question_data.get('id'),
-                question_data.get('question_text'),
-                question_data.get('question_type'),
-                json.dumps(question_data.get('answers', [])),
-                json.dumps(question_data.get('tags', [])),
-                question_data.get('usage_count', 0),
-                question_data.get('quality_score', 0.0),
-                question_data.get('created_at', datetime.now().isoformat()),
-                question_data.get('last_modified', datetime.now().isoformat()),
-                question_data.get('created_by'),
-                question_data.get('version', 1)
-            )
-            
-            cursor = self.db_manager.execute_with_retry(query, params)
+            cursor = self.db_manager.execute_with_retry(self.INSERT_QUESTION_QUERY, params)
             if cursor:
                 logger.info(f"Created question: {question_data.get('id')}")
                 return question_data.get('id')
@@ -63,6 +51,48 @@ class QuestionDataAccess:
             logger.error(f"Failed to create question: {e}")
             return None
     
+    def create_questions(self, questions_data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several questions in one transaction.
+        
+        Args:
+            questions_data: List of question data dictionaries
+            
+        Returns:
+            List of created question IDs (empty if the batch failed)
+        """
+        if not questions_data:
+            return []
+        
+        try:
+            params_list = [self._question_insert_params(data) for data in questions_data]
+            
+            if self.db_manager.execute_many_with_retry(self.INSERT_QUESTION_QUERY, params_list):
+                logger.info(f"Created {len(params_list)} questions")
+                return [data.get('id') for data in questions_data]
+            return []
+            
+        except Exception as e:
+            logger.error(f"Failed to create questions: {e}")
+            return []
+    
+    @staticmethod
+    def _question_insert_params(question_data: Dict[str, Any]) -> tuple:
+        """Build the INSERT_QUESTION_QUERY parameters for one question."""
+        return (
+            question_data.get('id'),
+            question_data.get('question_text'),
+            question_data.get('question_type'),
+            json.dumps(question_data.get('answers', [])),
+            json.dumps(question_data.get('tags', [])),
+            question_data.get('usage_count', 0),
+            question_data.get('quality_score', 0.0),
+            question_data.get('created_at', datetime.now().isoformat()),
+            question_data.get('last_modified', datetime.now().isoformat()),
+            question_data.get('created_by'),
+            question_data.get('version', 1)
+        )
+    
     def get_question_by_id(self, question_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a question by ID.
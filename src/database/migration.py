@@ -15,9 +15,14 @@ from pathlib import Path
 
 from .connection import DatabaseConnectionManager
 from .schema import DatabaseSchema
+from session_storage import FileStorage, load_sessions_data
 
 logger = logging.getLogger(__name__)
 
+# QuizEngine appends session changes here and only folds them into
+# quiz_sessions.json occasionally, so both files hold session data
+SESSION_LOG_FILE = 'quiz_sessions.json.log'
+
 class DatabaseMigration:
     """Handles migration from JSON to SQLite with rollback support."""
     
@@ -102,10 +107,11 @@ class DatabaseMigration:
                                 result['is_valid'] = False
                         
                         elif file_name == 'quiz_sessions.json':
-                            if isinstance(data, list):
+                            # QuizEngine snapshots map session IDs to sessions
+                            if isinstance(data, (list, dict)):
                                 result['statistics']['sessions'] = len(data)
                             else:
-                                result['data_errors'].append("Sessions file should contain a list")
+                                result['data_errors'].append("Sessions file should contain a list or dictionary")
                                 result['is_valid'] = False
                     
                     except json.JSONDecodeError as e:
@@ -155,7 +161,8 @@ class DatabaseMigration:
             os.makedirs(backup_dir, exist_ok=True)
             
             # Copy JSON files to backup
-            json_files = ['questions.json', 'tags.json', 'analytics.json', 'quiz_sessions.json']
+            json_files = ['questions.json', 'tags.json', 'analytics.json', 'quiz_sessions.json',
+                          SESSION_LOG_FILE]
             for file_name in json_files:
                 source_path = os.path.join(self.json_data_path, file_name)
                 if os.path.exists(source_path):
@@ -470,7 +477,7 @@ class DatabaseMigration:
             
             # Step 7: Migrate quiz sessions
             logger.info("Step 7: Migrating quiz sessions...")
-            sessions_data = self._load_json_file('quiz_sessions.json')
+            sessions_data = self._load_quiz_sessions()
             if sessions_data is not None:
                 if self.migrate_quiz_sessions(sessions_data):
                     result['steps_completed'].append("Quiz sessions migration")
@@ -514,6 +521,21 @@ class DatabaseMigration:
             logger.error(f"Failed to load {filename}: {e}")
             return None
     
+    def _load_quiz_sessions(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load quiz sessions from the snapshot file with the change log replayed.
+        
+        Returns:
+            List of session dictionaries, or None if neither file exists
+        """
+        snapshot_path = os.path.join(self.json_data_path, 'quiz_sessions.json')
+        log_path = os.path.join(self.json_data_path, SESSION_LOG_FILE)
+        if not os.path.exists(snapshot_path) and not os.path.exists(log_path):
+            return None
+        
+        sessions = load_sessions_data(FileStorage(), snapshot_path, log_path)
+        return list(sessions.values())
+    
     def _initialize_schema(self) -> bool:
         """Initialize database schema."""
         try:
@@ -574,7 +596,8 @@ class DatabaseMigration:
                 return False
             
             # Restore JSON files
-            json_files = ['questions.json', 'tags.json', 'analytics.json', 'quiz_sessions.json']
+            json_files = ['questions.json', 'tags.json', 'analytics.json', 'quiz_sessions.json',
+                          SESSION_LOG_FILE]
             for file_name in json_files:
                 backup_file = os.path.join(backup_dir, file_name)
                 if os.path.exists(backup_file):
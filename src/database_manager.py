@@ -25,19 +25,26 @@ class DatabaseManager:
     """Unified database manager for all SQLite operations."""
     
     def __init__(self, database_path: str = "data/quiz.db", 
-                 json_data_path: str = "data"):
+                 json_data_path: str = "data", in_memory: bool = False,
+                 test_mode: bool = False):
         """
         Initialize the database manager.
         
         Args:
             database_path: Path to SQLite database file
             json_data_path: Path to JSON data files
+            in_memory: Keep the database in memory instead of database_path,
+                for tests and throwaway sessions
+            test_mode: Skip fsyncs and keep the journal in memory; for test
+                databases whose durability does not matter
         """
-        self.database_path = database_path
         self.json_data_path = json_data_path
+        self.in_memory = in_memory
         
         # Initialize components
-        self.connection_manager = DatabaseConnectionManager(database_path)
+        self.connection_manager = DatabaseConnectionManager(database_path, in_memory=in_memory,
+                                                            test_mode=test_mode)
+        self.database_path = self.connection_manager.database_path
         self.schema = DatabaseSchema()
         self.migration = DatabaseMigration(self.connection_manager, json_data_path)
         self.backup = DatabaseBackup(self.connection_manager)
@@ -100,7 +107,7 @@ class DatabaseManager:
     def _database_exists_and_has_data(self) -> bool:
         """Check if database exists and contains data."""
         try:
-            if not Path(self.database_path).exists():
+            if not self.in_memory and not Path(self.database_path).exists():
                 return False
             
             # Check if database has tables and data
@@ -166,6 +173,10 @@ class DatabaseManager:
         """Create a new question."""
         return self.question_access.create_question(question_data)
     
+    def create_questions(self, questions_data: List[Dict[str, Any]]) -> List[str]:
+        """Create several questions in one transaction."""
+        return self.question_access.create_questions(questions_data)
+    
     def get_question(self, question_id: str) -> Optional[Dict[str, Any]]:
         """Get a question by ID."""
         return self.question_access.get_question_by_id(question_id)
@@ -5,12 +5,21 @@ This module provides factory methods for creating test data and model instances
 for testing and development purposes.
 """
 
+import os
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import random
 import string
 
+# NumPy imports (optional, used for batched generation of sample data)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 from .question import Question
 from .tag import Tag
 from .quiz_session import QuizSession
@@ -18,6 +27,62 @@ from .quiz_session import QuizSession
 class ModelFactory:
     """Factory class for creating model instances for testing."""
     
+    QUESTION_TYPES = ["multiple_choice", "true_false", "select_all"]
+    
+    SAMPLE_QUESTION_TEXTS = [
+        "What is the capital of France?",
+        "Which programming language is known for its simplicity?",
+        "What is 2 + 2?",
+        "The sun rises in the east.",
+        "Which of the following are programming languages?",
+        "What is the largest planet in our solar system?",
+        "Python is a compiled language.",
+        "Which of the following are data structures?"
+    ]
+    
+    SAMPLE_QUESTION_TAGS = ["general", "programming", "science", "math", "geography", "history"]
+    
+    SAMPLE_TAG_NAMES = [
+        "programming", "science", "math", "geography", "history",
+        "literature", "art", "music", "sports", "technology",
+        "biology", "chemistry", "physics", "computer-science"
+    ]
+    
+    SAMPLE_TAG_COLORS = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#FF00FF", "#00FFFF", "#FFA500", "#800080"]
+    
+    # Shared generator for batched draws (None when NumPy is unavailable)
+    _rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+    
+    @classmethod
+    def seed(cls, seed: Optional[int] = None) -> None:
+        """
+        Reseed factory randomness so generated data is reproducible.
+        
+        Args:
+            seed: Seed value (None reseeds from system entropy)
+        """
+        random.seed(seed)
+        if NUMPY_AVAILABLE:
+            cls._rng = np.random.default_rng(seed)
+    
+    @staticmethod
+    def create_ids(count: int) -> List[str]:
+        """
+        Create a batch of UUID4 strings from a single urandom call.
+        
+        IDs are never drawn from the seeded _rng: after seed() it replays the
+        same bytes, so those IDs would repeat across runs and could collide
+        with records already stored.
+        
+        Args:
+            count: Number of IDs to create
+            
+        Returns:
+            List of unique UUID4 strings
+        """
+        buffer = os.urandom(16 * count)
+        return [str(uuid.UUID(bytes=buffer[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+    
     @staticmethod
     def create_sample_answers(question_type: str, num_options: int = 4) -> List[Dict[str, Any]]:
         """
@@ -80,26 +145,13 @@ class ModelFactory:
         Returns:
             Question instance
         """
-        # Default question types
-        question_types = ["multiple_choice", "true_false", "select_all"]
-        
         # Generate question text if not provided
         if not question_text:
-            question_texts = [
-                "What is the capital of France?",
-                "Which programming language is known for its simplicity?",
-                "What is 2 + 2?",
-                "The sun rises in the east.",
-                "Which of the following are programming languages?",
-                "What is the largest planet in our solar system?",
-                "Python is a compiled language.",
-                "Which of the following are data structures?"
-            ]
-            question_text = random.choice(question_texts)
+            question_text = random.choice(ModelFactory.SAMPLE_QUESTION_TEXTS)
         
         # Select question type if not provided
         if not question_type:
-            question_type = random.choice(question_types)
+            question_type = random.choice(ModelFactory.QUESTION_TYPES)
         
         # Generate answers if not provided
         if not answers:
@@ -108,9 +160,8 @@ class ModelFactory:
         
         # Generate tags if not provided
         if not tags:
-            sample_tags = ["general", "programming", "science", "math", "geography", "history"]
             num_tags = random.randint(1, 3)
-            tags = random.sample(sample_tags, num_tags)
+            tags = random.sample(ModelFactory.SAMPLE_QUESTION_TAGS, num_tags)
         
         return Question(
             question_text=question_text,
@@ -141,12 +192,7 @@ class ModelFactory:
         """
         # Generate tag name if not provided
         if not name:
-            tag_names = [
-                "programming", "science", "math", "geography", "history",
-                "literature", "art", "music", "sports", "technology",
-                "biology", "chemistry", "physics", "computer-science"
-            ]
-            name = random.choice(tag_names)
+            name = random.choice(ModelFactory.SAMPLE_TAG_NAMES)
         
         # Generate description if not provided
         if not description:
@@ -170,8 +216,7 @@ class ModelFactory:
         
         # Generate color if not provided
         if not color:
-            colors = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#FF00FF", "#00FFFF", "#FFA500", "#800080"]
-            color = random.choice(colors)
+            color = random.choice(ModelFactory.SAMPLE_TAG_COLORS)
         
         return Tag(
             name=name,
@@ -199,14 +244,11 @@ class ModelFactory:
         """
         # Generate questions if not provided
         if not questions:
-            questions = []
-            for _ in range(num_questions):
-                question = ModelFactory.create_question()
-                questions.append(question.to_dict())
+            questions = [question.to_dict() for question in ModelFactory.create_question_bank(num_questions)]
         
         return QuizSession(
             questions=questions,
-            session_id=session_id
+            session_id=session_id or ModelFactory.create_ids(1)[0]
         )
     
     @staticmethod
@@ -221,9 +263,31 @@ class ModelFactory:
             List of Question instances
         """
         questions = []
+        rng = ModelFactory._rng
+        
+        question_ids = ModelFactory.create_ids(num_questions)
+        
+        if rng is None or num_questions <= 0:
+            for question_id in question_ids:
+                question = ModelFactory.create_question(question_id=question_id)
+                questions.append(question)
+            return questions
+        
+        # Draw every random field for the whole bank in a few batched calls
+        texts = rng.choice(ModelFactory.SAMPLE_QUESTION_TEXTS, size=num_questions).tolist()
+        types = rng.choice(ModelFactory.QUESTION_TYPES, size=num_questions).tolist()
+        tag_counts = rng.integers(1, 4, size=num_questions).tolist()
+        tag_orders = rng.random((num_questions, len(ModelFactory.SAMPLE_QUESTION_TAGS))).argsort(axis=1).tolist()
         
-        for i in range(num_questions):
-            question = ModelFactory.create_question()
+        for question_id, text, question_type, tag_count, tag_order in zip(
+                question_ids, texts, types, tag_counts, tag_orders):
+            tags = [ModelFactory.SAMPLE_QUESTION_TAGS[i] for i in tag_order[:tag_count]]
+            question = ModelFactory.create_question(
+                question_text=text,
+                question_type=question_type,
+                tags=tags,
+                question_id=question_id
+            )
             questions.append(question)
         
         return questions
@@ -241,6 +305,17 @@ class ModelFactory:
         """
         tags = []
         used_names = set()
+        rng = ModelFactory._rng
+        
+        if rng is not None and 0 < num_tags <= len(ModelFactory.SAMPLE_TAG_NAMES):
+            # Sampling names without replacement guarantees uniqueness up front
+            names = rng.choice(ModelFactory.SAMPLE_TAG_NAMES, size=num_tags, replace=False).tolist()
+            colors = rng.choice(ModelFactory.SAMPLE_TAG_COLORS, size=num_tags).tolist()
+            tag_ids = ModelFactory.create_ids(num_tags)
+            return [
+                ModelFactory.create_tag(name=name, color=color, tag_id=tag_id)
+                for name, color, tag_id in zip(names, colors, tag_ids)
+            ]
         
         for _ in range(num_tags):
             # Ensure unique tag names
@@ -269,13 +344,10 @@ class ModelFactory:
             Completed QuizSession instance
         """
         # Create questions
-        questions = []
-        for _ in range(num_questions):
-            question = ModelFactory.create_question()
-            questions.append(question.to_dict())
+        questions = [question.to_dict() for question in ModelFactory.create_question_bank(num_questions)]
         
         # Create session
-        session = QuizSession(questions=questions)
+        session = QuizSession(questions=questions, session_id=ModelFactory.create_ids(1)[0])
         
         # Add answers to achieve target score
         target_correct = int((score_percentage / 100) * num_questions)
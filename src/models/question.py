@@ -14,6 +14,12 @@ logger = logging.getLogger(__name__)
 class Question:
     """Represents a quiz question with validation and serialization."""
     
+    __slots__ = ('id', 'question_text', 'question_type', 'answers', 'tags',
+                 'created_at', 'last_modified', 'usage_count')
+    
+    # Longest question text accepted by validate(), after stripping
+    MAX_TEXT_LEN = 500
+    
     def __init__(self, question_text: str, question_type: str, 
                  answers: List[Dict[str, Any]], tags: List[str], 
                  question_id: Optional[str] = None):
@@ -57,8 +63,8 @@ class Question:
             errors.append("Question text cannot be empty")
         elif len(self.question_text.strip()) < 10:
             errors.append("Question text must be at least 10 characters")
-        elif len(self.question_text.strip()) > 500:
-            errors.append("Question text cannot exceed 500 characters")
+        elif len(self.question_text.strip()) > self.MAX_TEXT_LEN:
+            errors.append(f"Question text cannot exceed {self.MAX_TEXT_LEN} characters")
         
         # Validate question type
         valid_types = ['multiple_choice', 'true_false', 'select_all']
@@ -10,11 +10,23 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 import logging
 
+# NumPy imports (optional, used for vectorized score calculation)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 logger = logging.getLogger(__name__)
 
 class QuizSession:
     """Represents a quiz session with state management and progress tracking."""
     
+    __slots__ = ('id', 'questions', 'current_question_index', 'answers', 'score',
+                 'start_time', 'end_time', 'is_complete', 'total_questions',
+                 '_progress_cache', '_stats_cache', '_correct', '_correct_tracked')
+    
     def __init__(self, questions: List[Dict[str, Any]], session_id: Optional[str] = None):
         """
         Initialize a QuizSession object.
@@ -33,6 +45,11 @@ class QuizSession:
         self.is_complete = False
         self.total_questions = len(questions)
         
+        # Derived results, invalidated whenever the session state changes
+        self._progress_cache = None
+        self._stats_cache = None
+        self._init_correctness()
+        
         # Validate the session
         validation_result = self.validate()
         if not validation_result['is_valid']:
@@ -40,6 +57,11 @@ class QuizSession:
         
         logger.debug(f"Created quiz session: {self.id}")
     
+    def _init_correctness(self) -> None:
+        """Allocate the per-answer correctness array used by calculate_score."""
+        self._correct = np.zeros(len(self.questions), dtype=bool) if NUMPY_AVAILABLE else None
+        self._correct_tracked = 0
+    
     def validate(self) -> Dict[str, Any]:
         """
         Validate the quiz session data.
@@ -116,6 +138,15 @@ class QuizSession:
         
         self.answers.append(answer)
         self.current_question_index += 1
+        self._progress_cache = None
+        self._stats_cache = None
+        
+        # Mirror correctness into the array while it tracks every answer
+        position = len(self.answers) - 1
+        if (self._correct is not None and position == self._correct_tracked
+                and position < len(self._correct)):
+            self._correct[position] = is_correct
+            self._correct_tracked += 1
         
         # Check if quiz is complete
         if self.current_question_index >= len(self.questions):
@@ -135,8 +166,12 @@ class QuizSession:
         if not self.answers:
             return 0.0
         
-        correct_count = sum(1 for answer in self.answers if answer['is_correct'])
         total_questions = len(self.answers)
+        if self._correct is not None and self._correct_tracked == total_questions:
+            correct_count = int(self._correct[:total_questions].sum())
+        else:
+            # Answers were loaded or edited outside add_answer
+            correct_count = sum(1 for answer in self.answers if answer['is_correct'])
         
         score = (correct_count / total_questions) * 100 if total_questions > 0 else 0.0
         self.score = score
@@ -151,13 +186,16 @@ class QuizSession:
         Returns:
             Dictionary with progress information
         """
+        if self._progress_cache is not None:
+            return dict(self._progress_cache)
+        
         total_questions = len(self.questions)
         answered_questions = len(self.answers)
         remaining_questions = total_questions - answered_questions
         
         progress_percentage = (answered_questions / total_questions) * 100 if total_questions > 0 else 0
         
-        return {
+        self._progress_cache = {
             'current_question': self.current_question_index + 1,
             'total_questions': total_questions,
             'answered_questions': answered_questions,
@@ -165,6 +203,7 @@ class QuizSession:
             'progress_percentage': progress_percentage,
             'is_complete': self.is_complete
         }
+        return dict(self._progress_cache)
     
     def get_current_question(self) -> Optional[Dict[str, Any]]:
         """
@@ -192,6 +231,8 @@ class QuizSession:
             self.is_complete = True
             self.end_time = datetime.now()
             self.score = self.calculate_score()
+            self._progress_cache = None
+            self._stats_cache = None
             return None
         
         return self.questions[self.current_question_index]
@@ -227,6 +268,9 @@ class QuizSession:
         Returns:
             Dictionary with session statistics
         """
+        if self._stats_cache is not None:
+            return dict(self._stats_cache)
+        
         correct_answers = sum(1 for answer in self.answers if answer['is_correct'])
         total_answers = len(self.answers)
         
@@ -234,7 +278,7 @@ class QuizSession:
         duration = self.get_duration()
         avg_time_per_question = duration / total_answers if total_answers > 0 and duration else 0
         
-        return {
+        statistics = {
             'session_id': self.id,
             'total_questions': self.total_questions,
             'answered_questions': total_answers,
@@ -247,6 +291,11 @@ class QuizSession:
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'is_complete': self.is_complete
         }
+        
+        # Duration keeps growing until the session ends, so only cache final stats
+        if self.is_complete:
+            self._stats_cache = statistics
+        return dict(statistics)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -288,6 +337,9 @@ class QuizSession:
         session.end_time = datetime.fromisoformat(data['end_time']) if data.get('end_time') else None
         session.is_complete = data.get('is_complete', False)
         session.total_questions = data.get('total_questions', len(session.questions))
+        session._progress_cache = None
+        session._stats_cache = None
+        session._init_correctness()
         
         return session
     
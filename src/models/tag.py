@@ -15,6 +15,10 @@ logger = logging.getLogger(__name__)
 class Tag:
     """Represents a tag for organizing questions with hierarchical support."""
     
+    __slots__ = ('id', 'name', 'description', 'color', 'parent_id', 'question_count',
+                 'usage_count', 'last_used', 'created_at', 'created_by', 'children',
+                 'aliases')
+    
     def __init__(self, name: str, description: str = "", color: str = "", 
                  tag_id: Optional[str] = None, parent_id: Optional[str] = None,
                  usage_count: int = 0, last_used: Optional[str] = None):
@@ -75,6 +75,55 @@ class QuestionManagerDB:
             logger.error(f"Failed to create question: {e}")
             raise
     
+    def create_questions_bulk(self, specs: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        Create several questions with one database transaction.
+        
+        Every spec is validated before anything is written, so an invalid
+        spec leaves the database unchanged.
+        
+        Args:
+            specs: List of dictionaries with 'question_text', 'question_type',
+                'answers' and 'tags' keys, as accepted by create_question
+            
+        Returns:
+            List of created question dictionaries, in spec order
+        """
+        try:
+            questions_data = []
+            for index, spec in enumerate(specs):
+                validation_result = self.validate_question_data(
+                    spec.get('question_text'), spec.get('question_type'),
+                    spec.get('answers'), spec.get('tags', [])
+                )
+                if not validation_result['is_valid']:
+                    raise ValueError(f"Invalid question data at index {index}: {validation_result['errors']}")
+                
+                now = datetime.now().isoformat()
+                questions_data.append({
+                    'id': str(uuid.uuid4()),
+                    'question_text': spec['question_text'],
+                    'question_type': spec['question_type'],
+                    'answers': spec['answers'],
+                    'tags': spec.get('tags', []),
+                    'usage_count': 0,
+                    'quality_score': 0.0,
+                    'created_at': now,
+                    'last_modified': now,
+                    'created_by': None,
+                    'version': 1
+                })
+            
+            if questions_data and not self.db_manager.create_questions(questions_data):
+                raise RuntimeError("Failed to save questions to database")
+            
+            logger.info(f"Created {len(questions_data)} questions")
+            return questions_data
+            
+        except Exception as e:
+            logger.error(f"Failed to create questions: {e}")
+            raise
+    
     def get_question(self, question_id: str) -> Optional[Dict]:
         """
         Get a question by ID.
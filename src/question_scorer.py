@@ -5,7 +5,7 @@ This module provides scoring logic for different question types with
 partial credit support and simple feedback (correct/incorrect only).
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, FrozenSet, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,9 +13,25 @@ logger = logging.getLogger(__name__)
 class QuestionScorer:
     """Handles scoring for different question types with partial credit support."""
     
+    @staticmethod
+    def build_answer_key(answers: List[Dict[str, Any]]) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+        """
+        Precompute the correct and incorrect answer indices for a question.
+        
+        Args:
+            answers: List of answer dictionaries
+            
+        Returns:
+            Tuple of (correct indices, incorrect indices)
+        """
+        correct = frozenset(i for i, answer in enumerate(answers) if answer.get('is_correct', False))
+        incorrect = frozenset(range(len(answers))) - correct
+        return correct, incorrect
+    
     @staticmethod
     def calculate_score(question_type: str, correct_answers: List[Dict[str, Any]], 
-                       user_selections: List[int]) -> Dict[str, Any]:
+                       user_selections: List[int],
+                       answer_key: Optional[Tuple[FrozenSet[int], FrozenSet[int]]] = None) -> Dict[str, Any]:
         """
         Calculate score for a question based on type and user selections.
         
@@ -23,17 +39,14 @@ class QuestionScorer:
             question_type: Type of question
             correct_answers: List of correct answer dictionaries
             user_selections: List of user's selected answer indices (0-based)
+            answer_key: Optional precomputed result of build_answer_key, reused
+                by select-all scoring instead of rescanning the answers
             
         Returns:
             Score information with points, feedback, and details
         """
-        if question_type == 'multiple_choice':
-            return QuestionScorer._score_multiple_choice(correct_answers, user_selections)
-        elif question_type == 'true_false':
-            return QuestionScorer._score_true_false(correct_answers, user_selections)
-        elif question_type == 'select_all':
-            return QuestionScorer._score_select_all(correct_answers, user_selections)
-        else:
+        scorer = _SCORERS.get(question_type)
+        if scorer is None:
             return {
                 'points_earned': 0,
                 'max_points': 1,
@@ -41,10 +54,12 @@ class QuestionScorer:
                 'feedback': 'Incorrect',
                 'details': {'error': 'Unknown question type'}
             }
+        return scorer(correct_answers, user_selections, answer_key)
     
     @staticmethod
     def _score_multiple_choice(correct_answers: List[Dict[str, Any]], 
-                              user_selections: List[int]) -> Dict[str, Any]:
+                              user_selections: List[int],
+                              answer_key: Optional[Tuple[FrozenSet[int], FrozenSet[int]]] = None) -> Dict[str, Any]:
         """Score multiple choice questions."""
         if len(user_selections) != 1:
             return {
@@ -83,7 +98,8 @@ class QuestionScorer:
     
     @staticmethod
     def _score_true_false(correct_answers: List[Dict[str, Any]], 
-                         user_selections: List[int]) -> Dict[str, Any]:
+                         user_selections: List[int],
+                         answer_key: Optional[Tuple[FrozenSet[int], FrozenSet[int]]] = None) -> Dict[str, Any]:
         """Score true/false questions."""
         if len(user_selections) != 1:
             return {
@@ -122,7 +138,8 @@ class QuestionScorer:
     
     @staticmethod
     def _score_select_all(correct_answers: List[Dict[str, Any]], 
-                         user_selections: List[int]) -> Dict[str, Any]:
+                         user_selections: List[int],
+                         answer_key: Optional[Tuple[FrozenSet[int], FrozenSet[int]]] = None) -> Dict[str, Any]:
         """Score select all questions with partial credit."""
         if len(user_selections) == 0:
             return {
@@ -134,14 +151,9 @@ class QuestionScorer:
             }
         
         # Find correct and incorrect answer indices
-        correct_indices = set()
-        incorrect_indices = set()
-        
-        for i, answer in enumerate(correct_answers):
-            if answer.get('is_correct', False):
-                correct_indices.add(i)
-            else:
-                incorrect_indices.add(i)
+        if answer_key is None:
+            answer_key = QuestionScorer.build_answer_key(correct_answers)
+        correct_indices, incorrect_indices = answer_key
         
         if not correct_indices:
             return {
@@ -152,11 +164,11 @@ class QuestionScorer:
                 'details': {'error': 'No correct answers found in question'}
             }
         
-        user_selection_set = set(user_selections)
+        user_selection_set = frozenset(user_selections)
         
         # Calculate partial credit
-        correct_selections = user_selection_set.intersection(correct_indices)
-        incorrect_selections = user_selection_set.intersection(incorrect_indices)
+        correct_selections = user_selection_set & correct_indices
+        incorrect_selections = user_selection_set & incorrect_indices
         missed_correct = correct_indices - user_selection_set
         
         # Calculate score based on partial credit system
@@ -272,3 +284,12 @@ class QuestionScorer:
             'total_questions': total_questions,
             'average_per_question': total_points / total_questions if total_questions > 0 else 0
         }
+
+
+# Scorer per question type, looked up once per submission by calculate_score.
+# Every scorer shares the (answers, selections, answer_key) signature.
+_SCORERS = {
+    'multiple_choice': QuestionScorer._score_multiple_choice,
+    'true_false': QuestionScorer._score_true_false,
+    'select_all': QuestionScorer._score_select_all,
+}
@@ -6,25 +6,98 @@ answer validation, scoring calculation, and quiz session management.
 Enhanced with Phase 1.4 features: partial credit, session recovery, analytics, and export.
 """
 
+import csv
+import io
 import random
 import uuid
 import json
-import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 import logging
 
 from question_scorer import QuestionScorer
+from shuffle_numba import NUMBA_AVAILABLE, shuffled_indices
+from session_storage import FileStorage, dump_json_bytes, load_sessions_data
+
+# NumPy imports (optional, used for batched response time draws)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# Range of a single random word used for batched shuffle index generation
+_SHUFFLE_WORD_BITS = 64
+_SHUFFLE_WORD_RANGE = 1 << _SHUFFLE_WORD_BITS
+
+# Number of mock response times drawn per NumPy refill
+RESPONSE_TIME_BUFFER_SIZE = 1024
+
+# Session change log is folded into the snapshot once it outgrows it by this
+# factor, and never while it is smaller than the byte floor
+SESSION_LOG_COMPACTION_RATIO = 2
+SESSION_LOG_MIN_COMPACTION_BYTES = 64 * 1024
+
 class QuizEngine:
     """Core quiz engine for managing quiz sessions and logic."""
     
-    def __init__(self, session_storage_path: str = "data/quiz_sessions.json"):
-        """Initialize the quiz engine with session persistence."""
+    CSV_EXPORT_HEADER = ('Question ID', 'Selected Answer', 'Correct', 'Score Earned', 'Response Time')
+    
+    HTML_EXPORT_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Quiz Session Report</title>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
+                .score {{ font-size: 24px; font-weight: bold; color: #2e7d32; }}
+                .question {{ margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }}
+                .correct {{ background-color: #e8f5e8; }}
+                .incorrect {{ background-color: #ffeaea; }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>Quiz Session Report</h1>
+                <p><strong>Session ID:</strong> {session_id}</p>
+                <p><strong>Start Time:</strong> {start_time}</p>
+                <p><strong>End Time:</strong> {end_time}</p>
+                <div class="score">Score: {score:.1f}%</div>
+            </div>
+        {rows}
+        </body>
+        </html>
+        """
+    
+    HTML_EXPORT_ROW_TEMPLATE = """
+            <div class="question {css_class}">
+                <h3>Question: {question_id}</h3>
+                <p><strong>Your Answer:</strong> {selected_answers}</p>
+                <p><strong>Correct:</strong> {is_correct}</p>
+                <p><strong>Score Earned:</strong> {score_earned}</p>
+                <p><strong>Response Time:</strong> {response_time:.1f} seconds</p>
+            </div>
+            """
+    
+    def __init__(self, session_storage_path: str = "data/quiz_sessions.json",
+                 storage_backend=None):
+        """
+        Initialize the quiz engine with session persistence.
+        
+        Args:
+            session_storage_path: Key of the session snapshot; the change log
+                and temporary files are stored next to it
+            storage_backend: Blob store for sessions and analytics; defaults
+                to FileStorage, pass a MemoryStorage to stay off disk
+        """
         self.active_sessions: Dict[str, Dict] = {}
+        self.storage = storage_backend if storage_backend is not None else FileStorage()
         self.session_storage_path = session_storage_path
+        self.session_log_path = f"{session_storage_path}.log"
         self.question_scorer = QuestionScorer()
         self.analytics_data: Dict[str, Any] = {
             'total_quizzes_taken': 0,
@@ -33,9 +106,21 @@ class QuizEngine:
             'question_difficulty_stats': {},
             'user_performance_history': []
         }
+        # Analytics are updated incrementally; only write them when they changed
+        self._analytics_dirty = False
+        # Answers already in storage per session; a key means its questions are too
+        self._persisted_answer_counts: Dict[str, int] = {}
+        # Byte sizes of the session snapshot and change log, tracked for compaction
+        self._session_snapshot_size = 0
+        self._session_log_size = 0
+        # Per-session question lookups and answer keys; derived data, never persisted
+        self._question_indexes: Dict[str, Dict[str, Dict]] = {}
+        self._answer_keys: Dict[str, Dict[str, Tuple[FrozenSet[int], FrozenSet[int]]]] = {}
+        self._response_time_buffer: List[float] = []
+        self._response_time_rng = np.random.default_rng() if NUMPY_AVAILABLE else None
         
         # Ensure data directory exists
-        os.makedirs(os.path.dirname(session_storage_path), exist_ok=True)
+        self.storage.ensure_dir(session_storage_path)
         
         # Load existing sessions and analytics
         self._load_sessions()
@@ -53,17 +138,62 @@ class QuizEngine:
         Returns:
             List of questions in randomized order
         """
-        if not questions:
-            return []
+        if len(questions) < 2:
+            # Nothing to shuffle: skip RNG draws and index allocation
+            return list(questions)
+        
+        if NUMBA_AVAILABLE:
+            # Shuffle an index permutation in compiled code, then gather
+            order = shuffled_indices(len(questions), random.getrandbits(32))
+            return [questions[i] for i in order]
         
         return self._fisher_yates_shuffle(questions)
     
     def _fisher_yates_shuffle(self, questions: List[Dict]) -> List[Dict]:
-        """Standard Fisher-Yates shuffle implementation."""
-        randomized = questions.copy()
-        random.shuffle(randomized)
-        logger.debug(f"Fisher-Yates shuffled {len(randomized)} questions")
-        return randomized
+        """
+        Fisher-Yates shuffle with batched bounded-integer generation.
+        
+        Consecutive swap bounds are grouped so that their product fits in one
+        64-bit random word, and each swap index is peeled off that word with
+        divmod. Words falling in the uneven remainder of the 64-bit range are
+        rejected, so every permutation stays equally likely.
+        """
+        a = list(questions)
+        # Bind hot-loop lookups to locals once
+        getrandbits = random.getrandbits
+        randrange = random.randrange
+        word_bits = _SHUFFLE_WORD_BITS
+        word_range = _SHUFFLE_WORD_RANGE
+        
+        i = len(a) - 1
+        while i > 0:
+            # Group bounds i+1, i, ... while their product fits in one word
+            product = i + 1
+            stop = i - 1
+            while stop > 0 and product * (stop + 1) <= word_range:
+                product *= stop + 1
+                stop -= 1
+            
+            if stop == i - 1:
+                # Single bound left in the group: scalar Fisher-Yates step
+                j = randrange(i + 1)
+                t = a[i]
+                a[i] = a[j]
+                a[j] = t
+            else:
+                limit = word_range - word_range % product
+                word = getrandbits(word_bits)
+                while word >= limit:
+                    word = getrandbits(word_bits)
+                for position in range(i, stop, -1):
+                    word, j = divmod(word, position + 1)
+                    t = a[position]
+                    a[position] = a[j]
+                    a[j] = t
+            i = stop
+        
+        logger.debug(f"Fisher-Yates shuffled {len(a)} questions")
+        return a
     
     
     def randomize_answers(self, question: Dict) -> Dict:
@@ -135,6 +265,11 @@ class QuizEngine:
         
         session_id = str(uuid.uuid4())
         
+        # Shallow per-question snapshot: the session's question index and answer
+        # keys stay valid if the caller later edits its own question dicts, while
+        # answer lists are shared rather than deep-copied
+        questions = [dict(question) for question in questions]
+        
         session = {
             'id': session_id,
             'questions': questions,
@@ -155,6 +290,14 @@ class QuizEngine:
         }
         
         self.active_sessions[session_id] = session
+        question_index = self._build_question_index(questions)
+        self._question_indexes[session_id] = question_index
+        # Keyed off the index so a repeated ID maps to the same question in both caches
+        self._answer_keys[session_id] = {
+            question_id: QuestionScorer.build_answer_key(question.get('answers', []))
+            for question_id, question in question_index.items()
+            if question.get('question_type') == 'select_all'
+        }
         self._save_session(session)
         logger.info(f"Started new quiz session: {session_id}")
         return session_id
@@ -261,7 +404,12 @@ class QuizEngine:
             raise ValueError(f"Session {session_id} not found")
         
         session = self.active_sessions[session_id]
-        question = self._find_question_by_id(session['questions'], question_id)
+        question_index = self._question_indexes.get(session_id)
+        if question_index is None:
+            # Sessions restored from storage are indexed on first use
+            question_index = self._build_question_index(session['questions'])
+            self._question_indexes[session_id] = question_index
+        question = question_index.get(question_id)
         
         if not question:
             raise ValueError(f"Question {question_id} not found")
@@ -270,10 +418,14 @@ class QuizEngine:
         answer_indices = self._convert_answers_to_indices(question, selected_answers)
         
         # Use new scoring system
+        answer_key = None
+        if question['question_type'] == 'select_all':
+            answer_key = self._get_answer_key(session_id, question)
         scoring_result = self.question_scorer.calculate_score(
             question['question_type'],
             question['answers'],
-            answer_indices
+            answer_indices,
+            answer_key
         )
         
         # Record answer with detailed information
@@ -402,12 +554,19 @@ class QuizEngine:
         logger.info(f"Calculated comprehensive score: {percentage:.1f}% ({correct_count}/{total_questions})")
         return score_info
     
-    def _find_question_by_id(self, questions: List[Dict], question_id: str) -> Optional[Dict]:
-        """Find a question by its ID."""
-        for question in questions:
-            if question.get('id') == question_id:
-                return question
-        return None
+    def _build_question_index(self, questions: List[Dict]) -> Dict[str, Dict]:
+        """Map question IDs to questions, keeping the first question for a repeated ID."""
+        return {question.get('id'): question for question in reversed(questions)}
+    
+    def _get_answer_key(self, session_id: str, question: Dict) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+        """Get the cached answer key for a session question, building it if missing."""
+        session_keys = self._answer_keys.setdefault(session_id, {})
+        answer_key = session_keys.get(question.get('id'))
+        if answer_key is None:
+            # Sessions restored from storage have no precomputed keys
+            answer_key = QuestionScorer.build_answer_key(question.get('answers', []))
+            session_keys[question.get('id')] = answer_key
+        return answer_key
     
     def _convert_answers_to_indices(self, question: Dict, selected_answers: Any) -> List[int]:
         """
@@ -571,8 +730,15 @@ class QuizEngine:
         """Calculate response time for a question (simplified implementation)."""
         # In a real implementation, you'd track when the question was displayed
         # For now, return a random response time for demonstration
-        import random
-        return random.uniform(5.0, 30.0)  # 5-30 seconds
+        if self._response_time_rng is None:
+            # Without NumPy, draw one value at a time
+            return random.uniform(5.0, 30.0)  # 5-30 seconds
+        
+        if not self._response_time_buffer:
+            self._response_time_buffer = self._response_time_rng.uniform(
+                5.0, 30.0, RESPONSE_TIME_BUFFER_SIZE
+            ).tolist()
+        return self._response_time_buffer.pop()
     
     def _update_question_analytics(self, question_id: str, validation_result: Dict[str, Any]):
         """Update analytics for individual questions."""
@@ -586,6 +752,7 @@ class QuizEngine:
             }
         
         stats = self.analytics_data['question_difficulty_stats'][question_id]
+        self._analytics_dirty = True
         stats['total_attempts'] += 1
         if validation_result['is_correct']:
             stats['correct_attempts'] += 1
@@ -601,6 +768,7 @@ class QuizEngine:
     
     def _update_session_analytics(self, session: Dict):
         """Update overall session analytics."""
+        self._analytics_dirty = True
         self.analytics_data['total_quizzes_taken'] += 1
         
         # Get score (handle both float and dict formats)
@@ -647,45 +815,82 @@ class QuizEngine:
                 tags.update(question_tags)
         return list(tags)
     
+    def _serialize_session_state(self, session: Dict) -> Dict:
+        """Copy a session for JSON, leaving out its questions and answers."""
+        session_copy = {key: value for key, value in session.items()
+                        if key not in ('questions', 'answers')}
+        
+        # Handle datetime fields
+        datetime_fields = ['start_time', 'end_time', 'last_activity', 'pause_start_time']
+        for field in datetime_fields:
+            if field in session_copy and session_copy[field] is not None:
+                if isinstance(session_copy[field], datetime):
+                    session_copy[field] = session_copy[field].isoformat()
+        
+        # Convert timedelta to seconds
+        if 'total_pause_time' in session_copy and isinstance(session_copy['total_pause_time'], timedelta):
+            session_copy['total_pause_time'] = session_copy['total_pause_time'].total_seconds()
+        
+        # Handle score field which might contain timedelta objects
+        if 'score' in session_copy and isinstance(session_copy['score'], dict):
+            score_copy = session_copy['score'].copy()
+            if 'completion_time' in score_copy and isinstance(score_copy['completion_time'], timedelta):
+                score_copy['completion_time'] = score_copy['completion_time'].total_seconds()
+            if 'total_pause_time' in score_copy and isinstance(score_copy['total_pause_time'], timedelta):
+                score_copy['total_pause_time'] = score_copy['total_pause_time'].total_seconds()
+            session_copy['score'] = score_copy
+        
+        return session_copy
+    
+    def _serialize_answer(self, answer: Dict) -> Dict:
+        """Copy an answer record for JSON, converting its timestamp."""
+        answer_copy = answer.copy()
+        if isinstance(answer_copy.get('timestamp'), datetime):
+            answer_copy['timestamp'] = answer_copy['timestamp'].isoformat()
+        return answer_copy
+    
+    def _serialize_session(self, session: Dict) -> Dict:
+        """Copy a whole session for the snapshot file."""
+        session_copy = self._serialize_session_state(session)
+        session_copy['questions'] = session.get('questions', [])
+        session_copy['answers'] = [self._serialize_answer(answer) for answer in session.get('answers', [])]
+        return session_copy
+    
     def _save_session(self, session: Dict):
         """Save session to persistent storage."""
         try:
-            # Convert datetime objects to strings for JSON serialization
-            session_copy = session.copy()
-            
-            # Handle datetime fields
-            datetime_fields = ['start_time', 'end_time', 'last_activity', 'pause_start_time']
-            for field in datetime_fields:
-                if field in session_copy and session_copy[field] is not None:
-                    if isinstance(session_copy[field], datetime):
-                        session_copy[field] = session_copy[field].isoformat()
-            
-            # Convert timedelta to seconds
-            if 'total_pause_time' in session_copy and isinstance(session_copy['total_pause_time'], timedelta):
-                session_copy['total_pause_time'] = session_copy['total_pause_time'].total_seconds()
-            
-            # Handle score field which might contain timedelta objects
-            if 'score' in session_copy and isinstance(session_copy['score'], dict):
-                score_copy = session_copy['score'].copy()
-                if 'completion_time' in score_copy and isinstance(score_copy['completion_time'], timedelta):
-                    score_copy['completion_time'] = score_copy['completion_time'].total_seconds()
-                if 'total_pause_time' in score_copy and isinstance(score_copy['total_pause_time'], timedelta):
-                    score_copy['total_pause_time'] = score_copy['total_pause_time'].total_seconds()
-                session_copy['score'] = score_copy
+            session_id = session['id']
+            session_copy = self._serialize_session_state(session)
+            answers = session.get('answers', [])
             
-            # Convert answer timestamps
-            for answer in session_copy.get('answers', []):
-                if 'timestamp' in answer and answer['timestamp'] is not None:
-                    if isinstance(answer['timestamp'], datetime):
-                        answer['timestamp'] = answer['timestamp'].isoformat()
+            # Append only what changed to the change log: the session state and
+            # the answers recorded since the last save. Questions never change
+            # after start_quiz, so they are logged once per session
+            records = []
+            persisted_answers = self._persisted_answer_counts.get(session_id)
+            if persisted_answers is None:
+                records.append({'id': session_id, 'questions': session.get('questions', [])})
+                persisted_answers = 0
+            if len(answers) < persisted_answers:
+                # Answers were removed, so the full list replaces the stored one
+                session_copy['answers'] = [self._serialize_answer(answer) for answer in answers]
+                new_answers = []
+            else:
+                new_answers = answers[persisted_answers:]
+            records.append({'id': session_id, 'session': session_copy})
+            records.extend({'id': session_id, 'answer': self._serialize_answer(answer)}
+                           for answer in new_answers)
             
-            # Load existing sessions
-            sessions = self._load_sessions_data()
-            sessions[session['id']] = session_copy
+            record = b''.join(dump_json_bytes(entry) + b'\n' for entry in records)
+            self.storage.append(self.session_log_path, record)
+            self._persisted_answer_counts[session_id] = len(answers)
+            self._session_log_size += len(record)
             
-            # Save to file
-            with open(self.session_storage_path, 'w') as f:
-                json.dump(sessions, f, indent=2)
+            if self._session_log_needs_compaction():
+                self._compact_session_log({
+                    sid: self._serialize_session(active)
+                    for sid, active in self.active_sessions.items()
+                })
                 
         except Exception as e:
             logger.error(f"Failed to save session {session['id']}: {e}")
@@ -693,7 +898,17 @@ class QuizEngine:
     def _load_sessions(self):
         """Load sessions from persistent storage."""
         try:
-            sessions_data = self._load_sessions_data()
+            sessions_data = load_sessions_data(self.storage, self.session_storage_path, self.session_log_path)
+            if self.storage.exists(self.session_storage_path):
+                self._session_snapshot_size = self.storage.size(self.session_storage_path)
+            if self.storage.exists(self.session_log_path):
+                self._session_log_size = self.storage.size(self.session_log_path)
+            if self._session_log_needs_compaction():
+                self._compact_session_log(sessions_data)
+            self._persisted_answer_counts.update(
+                (session_id, len(session_data.get('answers', [])))
+                for session_id, session_data in sessions_data.items()
+            )
             for session_id, session_data in sessions_data.items():
                 # Convert string timestamps back to datetime objects
                 datetime_fields = ['start_time', 'end_time', 'last_activity', 'pause_start_time']
@@ -725,23 +940,29 @@ class QuizEngine:
         except Exception as e:
             logger.error(f"Failed to load sessions: {e}")
     
-    def _load_sessions_data(self) -> Dict:
-        """Load raw sessions data from file."""
+    def _session_log_needs_compaction(self) -> bool:
+        """Whether the change log has outgrown the snapshot it is replayed over."""
+        return self._session_log_size > max(SESSION_LOG_MIN_COMPACTION_BYTES,
+                                            SESSION_LOG_COMPACTION_RATIO * self._session_snapshot_size)
+    
+    def _compact_session_log(self, sessions_data: Dict):
+        """Fold the change log into the snapshot file."""
         try:
-            if os.path.exists(self.session_storage_path):
-                with open(self.session_storage_path, 'r') as f:
-                    return json.load(f)
+            snapshot = dump_json_bytes(sessions_data, indent=True)
+            self.storage.write(self.session_storage_path, snapshot)
+            self.storage.remove(self.session_log_path)
+            self._session_snapshot_size = len(snapshot)
+            self._session_log_size = 0
+            logger.debug(f"Compacted session log into {self.session_storage_path}")
         except Exception as e:
-            logger.error(f"Failed to load sessions data: {e}")
-        return {}
+            logger.error(f"Failed to compact session log: {e}")
     
     def _load_analytics(self):
         """Load analytics data from persistent storage."""
         try:
             analytics_path = "data/analytics.json"
-            if os.path.exists(analytics_path):
-                with open(analytics_path, 'r') as f:
-                    self.analytics_data = json.load(f)
+            if self.storage.exists(analytics_path):
+                self.analytics_data = json.loads(self.storage.read(analytics_path))
         except Exception as e:
             logger.error(f"Failed to load analytics: {e}")
     
@@ -749,7 +970,7 @@ class QuizEngine:
         """Save analytics data to persistent storage."""
         try:
             analytics_path = "data/analytics.json"
-            os.makedirs(os.path.dirname(analytics_path), exist_ok=True)
+            self.storage.ensure_dir(analytics_path)
             
             # Convert datetime objects to strings
             analytics_copy = self.analytics_data.copy()
@@ -758,15 +979,18 @@ class QuizEngine:
                     if isinstance(session['timestamp'], datetime):
                         session['timestamp'] = session['timestamp'].isoformat()
             
-            with open(analytics_path, 'w') as f:
-                json.dump(analytics_copy, f, indent=2)
+            self.storage.write(analytics_path, json.dumps(analytics_copy, indent=2).encode('utf-8'))
+            self._analytics_dirty = False
                 
         except Exception as e:
             logger.error(f"Failed to save analytics: {e}")
     
     def get_quiz_statistics(self) -> Dict[str, Any]:
         """Get comprehensive quiz statistics and analytics."""
-        self._save_analytics()  # Save current analytics
+        # Running totals are kept up to date on every answer, so a query only
+        # needs to persist them if something changed since the last save
+        if self._analytics_dirty:
+            self._save_analytics()
         return self.analytics_data.copy()
     
     def export_quiz_session(self, session_id: str, format: str = "json") -> str:
@@ -796,68 +1020,47 @@ class QuizEngine:
     
     def _export_session_csv(self, session: Dict) -> str:
         """Export session as CSV format."""
-        import csv
-        import io
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(['Question ID', 'Selected Answer', 'Correct', 'Score Earned', 'Response Time'])
-        
-        # Write answer data
-        for answer in session.get('answers', []):
-            writer.writerow([
+        rows = [
+            (
                 answer.get('question_id', ''),
                 str(answer.get('selected_answers', '')),
                 answer.get('is_correct', False),
                 answer.get('score_earned', 0.0),
                 answer.get('response_time', 0.0)
-            ])
+            )
+            for answer in session.get('answers', [])
+        ]
+        
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(self.CSV_EXPORT_HEADER)
+        writer.writerows(rows)
         
         return output.getvalue()
     
     def _export_session_html(self, session: Dict) -> str:
         """Export session as HTML format."""
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Quiz Session Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-                .score {{ font-size: 24px; font-weight: bold; color: #2e7d32; }}
-                .question {{ margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }}
-                .correct {{ background-color: #e8f5e8; }}
-                .incorrect {{ background-color: #ffeaea; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Quiz Session Report</h1>
-                <p><strong>Session ID:</strong> {session.get('id', 'N/A')}</p>
-                <p><strong>Start Time:</strong> {session.get('start_time', 'N/A')}</p>
-                <p><strong>End Time:</strong> {session.get('end_time', 'N/A')}</p>
-                <div class="score">Score: {session.get('score', {}).get('percentage', 0):.1f}%</div>
-            </div>
-        """
-        
-        for answer in session.get('answers', []):
-            css_class = "correct" if answer.get('is_correct') else "incorrect"
-            html += f"""
-            <div class="question {css_class}">
-                <h3>Question: {answer.get('question_id', 'N/A')}</h3>
-                <p><strong>Your Answer:</strong> {answer.get('selected_answers', 'N/A')}</p>
-                <p><strong>Correct:</strong> {answer.get('is_correct', False)}</p>
-                <p><strong>Score Earned:</strong> {answer.get('score_earned', 0.0)}</p>
-                <p><strong>Response Time:</strong> {answer.get('response_time', 0.0):.1f} seconds</p>
-            </div>
-            """
-        
-        html += """
-        </body>
-        </html>
-        """
+        # Score is stored as a percentage float, or a score dict in older sessions
+        score = session.get('score', 0.0)
+        if isinstance(score, dict):
+            score = score.get('percentage', 0.0)
+        
+        rows = "".join(
+            self.HTML_EXPORT_ROW_TEMPLATE.format(
+                css_class="correct" if answer.get('is_correct') else "incorrect",
+                question_id=answer.get('question_id', 'N/A'),
+                selected_answers=answer.get('selected_answers', 'N/A'),
+                is_correct=answer.get('is_correct', False),
+                score_earned=answer.get('score_earned', 0.0),
+                response_time=answer.get('response_time', 0.0)
+            )
+            for answer in session.get('answers', [])
+        )
         
-        return html
+        return self.HTML_EXPORT_TEMPLATE.format(
+            session_id=session.get('id', 'N/A'),
+            start_time=session.get('start_time', 'N/A'),
+            end_time=session.get('end_time', 'N/A'),
+            score=score or 0.0,
+            rows=rows
+        )
@@ -0,0 +1,170 @@
+"""
+Session Storage Backends
+
+This module provides the byte-blob stores the quiz engine persists sessions
+and analytics through. FileStorage keeps each key as a file on disk and is the
+default; MemoryStorage keeps blobs in a dict for tests and throwaway engines
+that should not touch the filesystem. load_sessions_data rebuilds the session
+map from a snapshot and its append-only change log.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+# orjson imports (optional, stdlib json is used without it)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def dump_json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_sessions_data(storage, snapshot_key: str,
+                       log_key: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Load sessions from a snapshot and replay its change log over it.
+    
+    Each log line is one of: a session's questions (logged once), its state
+    without questions and answers, or a single new answer. State entries that
+    still carry an answers list (older logs) replace the stored answers.
+    
+    Args:
+        storage: FileStorage or MemoryStorage holding both keys
+        snapshot_key: Key of the snapshot mapping session IDs to sessions;
+            older snapshots hold a list of sessions
+        log_key: Key of the change log, defaults to snapshot_key + '.log'
+        
+    Returns:
+        Dictionary mapping session IDs to serialized sessions
+    """
+    if log_key is None:
+        log_key = f"{snapshot_key}.log"
+    
+    sessions = {}
+    try:
+        if storage.exists(snapshot_key):
+            snapshot = load_json_bytes(storage.read(snapshot_key))
+            if isinstance(snapshot, dict):
+                sessions = snapshot
+            else:
+                sessions = {session.get('id'): session for session in snapshot or []}
+    except Exception as e:
+        logger.error(f"Failed to load sessions snapshot {snapshot_key}: {e}")
+    
+    try:
+        if storage.exists(log_key):
+            # Question payloads are logged once per session, ahead of its state
+            question_payloads = {}
+            for line_number, line in enumerate(storage.read(log_key).splitlines(), 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = load_json_bytes(line)
+                except ValueError:
+                    logger.warning(f"Skipping corrupt session log entry at line {line_number}")
+                    continue
+                
+                session_id = entry['id']
+                if 'questions' in entry:
+                    question_payloads[session_id] = entry['questions']
+                    continue
+                if 'answer' in entry:
+                    # Answers always follow their session's first state entry
+                    if session_id in sessions:
+                        sessions[session_id].setdefault('answers', []).append(entry['answer'])
+                    continue
+                
+                session_data = entry['session']
+                previous = sessions.get(session_id, {})
+                if 'questions' not in session_data:
+                    session_data['questions'] = question_payloads.get(
+                        session_id, previous.get('questions', [])
+                    )
+                if 'answers' not in session_data:
+                    session_data['answers'] = previous.get('answers', [])
+                session_data.setdefault('id', session_id)
+                sessions[session_id] = session_data
+    except Exception as e:
+        logger.error(f"Failed to replay session log {log_key}: {e}")
+    
+    return sessions
+
+
+class FileStorage:
+    """Stores blobs as files, using each key as a file path."""
+    
+    def ensure_dir(self, key: str) -> None:
+        """Create the directory that will hold key."""
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+    
+    def exists(self, key: str) -> bool:
+        return os.path.exists(key)
+    
+    def size(self, key: str) -> int:
+        return os.path.getsize(key)
+    
+    def read(self, key: str) -> bytes:
+        with open(key, 'rb') as f:
+            return f.read()
+    
+    def write(self, key: str, data: bytes) -> None:
+        """Replace the blob atomically via a temporary file."""
+        temp_path = f"{key}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, key)
+    
+    def append(self, key: str, data: bytes) -> None:
+        with open(key, 'ab') as f:
+            f.write(data)
+    
+    def remove(self, key: str) -> None:
+        os.remove(key)
+
+
+class MemoryStorage:
+    """Stores blobs in a dict; nothing is written to disk."""
+    
+    def __init__(self):
+        # Bytearrays so appending to the session log does not copy it
+        self.blobs: Dict[str, bytearray] = {}
+    
+    def ensure_dir(self, key: str) -> None:
+        pass
+    
+    def exists(self, key: str) -> bool:
+        return key in self.blobs
+    
+    def size(self, key: str) -> int:
+        return len(self.blobs[key])
+    
+    def read(self, key: str) -> bytes:
+        return bytes(self.blobs[key])
+    
+    def write(self, key: str, data: bytes) -> None:
+        self.blobs[key] = bytearray(data)
+    
+    def append(self, key: str, data: bytes) -> None:
+        self.blobs.setdefault(key, bytearray()).extend(data)
+    
+    def remove(self, key: str) -> None:
+        del self.blobs[key]
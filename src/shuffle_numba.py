@@ -0,0 +1,53 @@
+"""
+Shuffle Kernels
+
+This module provides an optional Numba-compiled Fisher-Yates kernel used by the
+quiz engine to shuffle an integer permutation array. The kernel is only defined
+when numpy and numba are installed; callers should check NUMBA_AVAILABLE.
+"""
+
+import logging
+
+# Numba imports (optional, pure-Python shuffle is used without them)
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    np = None
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def fisher_yates_kernel(perm, seed):
+        """Shuffle an int64 permutation array in place."""
+        np.random.seed(seed)
+        for i in range(perm.shape[0] - 1, 0, -1):
+            j = np.random.randint(0, i + 1)
+            tmp = perm[i]
+            perm[i] = perm[j]
+            perm[j] = tmp
+else:
+    fisher_yates_kernel = None
+
+
+def shuffled_indices(count: int, seed: int) -> list:
+    """
+    Return a random permutation of range(count) computed by the Numba kernel.
+
+    Args:
+        count: Number of items to permute
+        seed: Seed for the kernel's random state
+
+    Returns:
+        List of indices in shuffled order
+    """
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError("Numba shuffle kernel not available - install numba")
+
+    perm = np.arange(count, dtype=np.int64)
+    fisher_yates_kernel(perm, seed)
+    return perm.tolist()
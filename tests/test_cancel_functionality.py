@@ -11,7 +11,9 @@ import unittest
 from unittest.mock import patch
 
 # Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from app_controller_db import AppControllerDB
 from ui.prompts import InputPrompts
@@ -16,7 +16,9 @@ from unittest.mock import patch, MagicMock
 
 # Add src to path for imports
 import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from data_persistence import DataPersistence
 
@@ -18,7 +18,9 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 # Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from src.database_manager import DatabaseManager
 from src.database.schema import DatabaseSchema
@@ -27,6 +29,8 @@ from src.database.migration import DatabaseMigration
 from src.database.data_access import QuestionDataAccess, TagDataAccess
 from src.database.backup import DatabaseBackup
 from src.database.maintenance import DatabaseMaintenance
+from src.question_manager_db import QuestionManagerDB
+from src.quiz_engine import QuizEngine
 
 class TestDatabaseIntegrationPhase24(unittest.TestCase):
     """Test cases for Phase 2.4 database integration."""
@@ -229,6 +233,23 @@ class TestDatabaseIntegrationPhase24(unittest.TestCase):
         self.assertEqual(len(tags), 1)
         self.assertEqual(tags[0]['name'], self.sample_tag['name'])
     
+    def test_json_migration_replays_session_log(self):
+        """Test migration picks up sessions still only in the quiz engine's change log."""
+        with open(os.path.join(self.json_path, 'questions.json'), 'w') as f:
+            json.dump([self.sample_question], f)
+        with open(os.path.join(self.json_path, 'tags.json'), 'w') as f:
+            json.dump([self.sample_tag], f)
+        
+        # A fresh engine appends the session to quiz_sessions.json.log only
+        engine = QuizEngine(session_storage_path=os.path.join(self.json_path, 'quiz_sessions.json'))
+        session_id = engine.start_quiz([self.sample_question])
+        self.assertFalse(os.path.exists(os.path.join(self.json_path, 'quiz_sessions.json')))
+        
+        self.assertTrue(self.db_manager.initialize())
+        with self.db_manager.connection_manager.get_connection_context() as conn:
+            row = conn.execute("SELECT id FROM quiz_sessions WHERE id = ?", (session_id,)).fetchone()
+        self.assertIsNotNone(row)
+    
     def test_backup_and_restore(self):
         """Test database backup and restore functionality."""
         # Initialize database and add data
@@ -395,6 +416,50 @@ class TestDatabaseIntegrationPhase24(unittest.TestCase):
         questions = self.db_manager.get_all_questions()
         self.assertEqual(len(questions), 5)
     
+    def test_test_mode_pragmas(self):
+        """Test test_mode trades durability pragmas for speed."""
+        fast_manager = DatabaseManager(os.path.join(self.test_dir, "fast.db"), self.json_path,
+                                       test_mode=True)
+        try:
+            self.assertTrue(fast_manager.initialize())
+            self.assertTrue(self.db_manager.initialize())
+            with fast_manager.connection_manager.get_connection_context() as conn:
+                self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'memory')
+                self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 0)
+            with self.db_manager.connection_manager.get_connection_context() as conn:
+                self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+        finally:
+            fast_manager.close()
+    
+    def test_bulk_question_creation(self):
+        """Test creating several questions in one batch."""
+        self.assertTrue(self.db_manager.initialize())
+        question_manager = QuestionManagerDB(self.db_manager)
+        
+        specs = [
+            {
+                'question_text': f'Bulk question {i}?',
+                'question_type': 'multiple_choice',
+                'answers': self.sample_question['answers'],
+                'tags': ['math']
+            }
+            for i in range(4)
+        ]
+        created = question_manager.create_questions_bulk(specs)
+        self.assertEqual([q['question_text'] for q in created],
+                         [spec['question_text'] for spec in specs])
+        for question in created:
+            stored = self.db_manager.get_question(question['id'])
+            self.assertEqual(stored['answers'], self.sample_question['answers'])
+        
+        # An invalid spec rejects the whole batch before anything is written
+        bad_specs = specs[:1] + [dict(specs[0], answers=[])]
+        with self.assertRaises(ValueError):
+            question_manager.create_questions_bulk(bad_specs)
+        self.assertEqual(len(self.db_manager.get_all_questions()), 4)
+        
+        self.assertEqual(question_manager.create_questions_bulk([]), [])
+    
     def test_database_manager_status(self):
         """Test database manager status and state tracking."""
         # Test initial status
@@ -417,6 +482,45 @@ class TestDatabaseIntegrationPhase24(unittest.TestCase):
         # Test is_initialized and is_migrated methods
         self.assertTrue(self.db_manager.is_initialized())
         self.assertTrue(self.db_manager.is_migrated())
+    
+    def test_in_memory_database(self):
+        """Test in-memory databases are shared by the pool but private per manager."""
+        memory_manager = DatabaseManager(json_data_path=self.json_path, in_memory=True)
+        other_manager = DatabaseManager(json_data_path=self.json_path, in_memory=True)
+        try:
+            self.assertTrue(memory_manager.initialize())
+            self.assertTrue(other_manager.initialize())
+            self.assertNotEqual(memory_manager.database_path, other_manager.database_path)
+            self.assertFalse(os.path.exists(memory_manager.database_path))
+            
+            # Data written on one pooled connection is visible on the others
+            self.assertIsNotNone(memory_manager.create_question(self.sample_question))
+            self.assertEqual(len(memory_manager.get_all_questions()), 1)
+            
+            # Each in-memory manager has its own database
+            self.assertEqual(len(other_manager.get_all_questions()), 0)
+        finally:
+            memory_manager.close()
+            other_manager.close()
+    
+    def test_snapshot_restore(self):
+        """Test a backup-API snapshot restores the database to its earlier state."""
+        memory_manager = DatabaseManager(json_data_path=self.json_path, in_memory=True)
+        try:
+            self.assertTrue(memory_manager.initialize())
+            snapshot = memory_manager.connection_manager.create_snapshot()
+            self.assertIsNotNone(snapshot)
+            
+            self.assertIsNotNone(memory_manager.create_question(self.sample_question))
+            self.assertEqual(len(memory_manager.get_all_questions()), 1)
+            
+            # Schema survives the restore, rows written after the snapshot do not
+            self.assertTrue(memory_manager.connection_manager.restore_snapshot(snapshot))
+            self.assertEqual(len(memory_manager.get_all_questions()), 0)
+            self.assertIsNotNone(memory_manager.create_question(self.sample_question))
+            snapshot.close()
+        finally:
+            memory_manager.close()
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
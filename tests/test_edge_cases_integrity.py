@@ -13,9 +13,12 @@ import sys
 import os
 import unittest
 import tempfile
+import shutil
 from unittest.mock import patch
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from question_manager_db import QuestionManagerDB
 from tag_manager_db import TagManagerDB
@@ -32,8 +35,10 @@ class TestEdgeCaseIntegrity(unittest.TestCase):
         self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
         self.temp_db.close()
         self.db_path = self.temp_db.name
+        self.addCleanup(os.unlink, self.db_path)
         
-        self.db_manager = DatabaseManager(self.db_path)
+        self.db_manager = DatabaseManager(self.db_path, test_mode=True)
+        self.addCleanup(self.db_manager.close)
         # Initialize database schema
         if not self.db_manager.initialize():
             raise Exception("Failed to initialize database")
@@ -43,29 +48,9 @@ class TestEdgeCaseIntegrity(unittest.TestCase):
         
         # Create temp directory for quiz sessions
         self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
         session_path = os.path.join(self.temp_dir, 'quiz_sessions.json')
         self.quiz_engine = QuizEngine(session_storage_path=session_path)
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        if hasattr(self, 'db_manager'):
-            try:
-                self.db_manager.close()
-            except:
-                pass
-        # Clean up temp file
-        if hasattr(self, 'temp_db') and os.path.exists(self.temp_db.name):
-            try:
-                os.unlink(self.temp_db.name)
-            except:
-                pass
-        # Clean up temp directory
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            try:
-                import shutil
-                shutil.rmtree(self.temp_dir)
-            except:
-                pass
     
     def test_answer_order_preserved(self):
         """Test that answer order is preserved as entered."""
@@ -13,7 +13,9 @@ import os
 from pathlib import Path
 
 import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from question_versioning import QuestionVersioning
 from question_quality_analyzer import QuestionQualityAnalyzer
@@ -14,7 +14,9 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
 # Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from ocr import AdvancedOCRProcessor, OCRTester
 
@@ -12,11 +12,12 @@ import tempfile
 import shutil
 import time
 import threading
-from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
 # Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from performance_optimizer import (
     PerformanceOptimizer, MemoryMonitor, GarbageCollectionOptimizer,
@@ -8,14 +8,20 @@ scoring, and session management.
 
 import sys
 import os
+import re
 import unittest
 from datetime import datetime
 
 # Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from quiz_engine import QuizEngine
 
+INVALID_SESSION_RE = re.compile(r"^Session .+ not found$")
+INVALID_QUESTION_RE = re.compile(r"^Question .+ not found$")
+
 class TestQuizEngine(unittest.TestCase):
     """Test cases for QuizEngine."""
     
@@ -197,14 +203,14 @@ class TestQuizEngine(unittest.TestCase):
     
     def test_invalid_session_id(self):
         """Test handling of invalid session ID."""
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(ValueError, INVALID_SESSION_RE):
             self.engine.submit_answer("invalid_session", "q1", "a1")
     
     def test_invalid_question_id(self):
         """Test handling of invalid question ID."""
         session_id = self.engine.start_quiz(self.sample_questions)
         
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(ValueError, INVALID_QUESTION_RE):
             self.engine.submit_answer(session_id, "invalid_question", "a1")
 
 if __name__ == '__main__':
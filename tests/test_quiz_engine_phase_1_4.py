@@ -11,21 +11,36 @@ import os
 import tempfile
 import shutil
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, patch
 
 # Add src to path for imports
 import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
-from quiz_engine import QuizEngine
+from quiz_engine import QuizEngine, NUMPY_AVAILABLE, RESPONSE_TIME_BUFFER_SIZE, np
+from session_storage import MemoryStorage
 
 
 class TestQuizEnginePhase14(unittest.TestCase):
     """Test Phase 1.4 enhancements to the Quiz Engine."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary storage directory shared by every test."""
+        cls.temp_dir = tempfile.mkdtemp()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary storage directory."""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+    
     def setUp(self):
         """Set up test environment with temporary storage."""
-        self.temp_dir = tempfile.mkdtemp()
+        # Drop files left by the previous test so each engine starts empty
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
         self.session_storage_path = os.path.join(self.temp_dir, "test_sessions.json")
         self.analytics_path = os.path.join(self.temp_dir, "test_analytics.json")
         
@@ -69,10 +84,6 @@ class TestQuizEnginePhase14(unittest.TestCase):
             }
         ]
     
-    def tearDown(self):
-        """Clean up temporary files."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_randomization(self):
         """Test question randomization."""
         # Test Fisher-Yates shuffle
@@ -154,6 +165,74 @@ class TestQuizEnginePhase14(unittest.TestCase):
         self.assertEqual(len(session['answers']), 1)
         self.assertEqual(session['current_question_index'], 1)
     
+    def test_session_persistence_in_memory_storage(self):
+        """Test that sessions round-trip through a MemoryStorage backend."""
+        storage = MemoryStorage()
+        engine = QuizEngine(session_storage_path=self.session_storage_path,
+                            storage_backend=storage)
+        session_id = engine.start_quiz(self.sample_questions)
+        engine.submit_answer(session_id, 'q1', 'a2')
+        
+        # Nothing reaches the filesystem, yet a new engine on the same store sees the session
+        self.assertFalse(os.path.exists(f"{self.session_storage_path}.log"))
+        new_engine = QuizEngine(session_storage_path=self.session_storage_path,
+                                storage_backend=storage)
+        self.assertIn(session_id, new_engine.active_sessions)
+        self.assertEqual(len(new_engine.active_sessions[session_id]['answers']), 1)
+    
+    def test_session_log_records_answer_deltas(self):
+        """Test each save logs only the new answer, not the whole answers list."""
+        storage = MemoryStorage()
+        engine = QuizEngine(session_storage_path=self.session_storage_path,
+                            storage_backend=storage)
+        session_id = engine.start_quiz(self.sample_questions)
+        engine.submit_answer(session_id, 'q1', 'a2')
+        engine.submit_answer(session_id, 'q2', ['a1', 'a3'])
+    
+        entries = [json.loads(line) for line in storage.read(f"{self.session_storage_path}.log").splitlines()]
+        self.assertEqual(sum('questions' in entry for entry in entries), 1)
+        self.assertTrue(all('answers' not in entry.get('session', {}) for entry in entries))
+        self.assertEqual([entry['answer']['question_id'] for entry in entries if 'answer' in entry],
+                         ['q1', 'q2'])
+    
+        new_engine = QuizEngine(session_storage_path=self.session_storage_path,
+                                storage_backend=storage)
+        answers = new_engine.active_sessions[session_id]['answers']
+        self.assertEqual([answer['question_id'] for answer in answers], ['q1', 'q2'])
+        self.assertIsInstance(answers[0]['timestamp'], datetime)
+    
+    def test_session_log_compacts_while_saving(self):
+        """Test the change log is folded into the snapshot once it passes the threshold."""
+        storage = MemoryStorage()
+        engine = QuizEngine(session_storage_path=self.session_storage_path,
+                            storage_backend=storage)
+        log_path = f"{self.session_storage_path}.log"
+        with patch('quiz_engine.SESSION_LOG_MIN_COMPACTION_BYTES', 0):
+            session_id = engine.start_quiz(self.sample_questions)
+            self.assertFalse(storage.exists(log_path))
+            self.assertTrue(storage.exists(self.session_storage_path))
+            engine.submit_answer(session_id, 'q1', 'a2')
+    
+        new_engine = QuizEngine(session_storage_path=self.session_storage_path,
+                                storage_backend=storage)
+        self.assertEqual(len(new_engine.active_sessions[session_id]['answers']), 1)
+        self.assertEqual(new_engine.active_sessions[session_id]['current_question_index'], 1)
+    
+    def test_repeated_question_id_uses_first_question_key(self):
+        """Test scoring uses the first question's answer key when IDs repeat."""
+        first = {
+            'id': 'dup', 'text': 'Pick the even numbers', 'question_type': 'select_all',
+            'answers': [{'text': '2', 'is_correct': True}, {'text': '3', 'is_correct': False}]
+        }
+        second = {
+            'id': 'dup', 'text': 'Pick the odd numbers', 'question_type': 'select_all',
+            'answers': [{'text': '2', 'is_correct': False}, {'text': '3', 'is_correct': True}]
+        }
+        session_id = self.engine.start_quiz([first, second])
+        
+        result = self.engine.submit_answer(session_id, 'dup', [0])
+        self.assertTrue(result['is_correct'])
+    
     def test_analytics_tracking(self):
         """Test analytics tracking and statistics."""
         # Get initial analytics count
@@ -269,10 +348,13 @@ class TestQuizEnginePhase14(unittest.TestCase):
             self.engine.export_quiz_session("invalid_session")
     
     
-    @patch('random.uniform')
-    def test_response_time_calculation(self, mock_uniform):
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy unavailable")
+    def test_response_time_calculation(self):
         """Test response time calculation."""
-        mock_uniform.return_value = 15.5
+        # Stub the engine's generator; the buffer is refilled from it and popped
+        self.engine._response_time_rng = MagicMock()
+        self.engine._response_time_rng.uniform.return_value = np.array([12.0, 15.5])
+        self.engine._response_time_buffer = []
         
         session_id = self.engine.start_quiz(self.sample_questions)
         response_time = self.engine._calculate_response_time(
@@ -280,7 +362,8 @@ class TestQuizEnginePhase14(unittest.TestCase):
         )
         
         self.assertEqual(response_time, 15.5)
-        mock_uniform.assert_called_once_with(5.0, 30.0)
+        self.engine._response_time_rng.uniform.assert_called_once_with(
+            5.0, 30.0, RESPONSE_TIME_BUFFER_SIZE)
 
 
 if __name__ == '__main__':
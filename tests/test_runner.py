@@ -6,34 +6,319 @@ generates coverage reports, and validates the entire application.
 """
 
 import unittest
+import asyncio
 import sys
 import os
+import io
+import functools
+import importlib
 import time
 import json
+import multiprocessing
 import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field, asdict, is_dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Iterable, Optional
 import logging
 
+# Coverage imports (optional, coverage is reported as unavailable without it)
+try:
+    import coverage
+    COVERAGE_AVAILABLE = True
+except ImportError:
+    COVERAGE_AVAILABLE = False
+    coverage = None
+
+# orjson imports (optional, stdlib json is used without it)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# pytest-xdist imports (optional, suites are sharded over a process pool without it)
+try:
+    import xdist  # noqa: F401
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
+
 # Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Mock scenario outcomes, keyed by scenario name
+_INTEGRATION_RESULTS = {
+    'complete_user_workflow': True,
+    'database_migration_workflow': True,
+    'import_export_workflow': True,
+    'analytics_workflow': True,
+    'ocr_workflow': True
+}
+
+_E2E_RESULTS = {
+    'complete_quiz_workflow': True,
+    'question_management_workflow': True,
+    'analytics_workflow': True,
+    'import_export_workflow': True
+}
+
+_PERF_RESULTS = {
+    'large_dataset_handling': {'success': True, 'metrics': {'memory_usage': '50MB', 'processing_time': '2.5s'}},
+    'memory_usage_test': {'success': True, 'metrics': {'peak_memory': '75MB', 'average_memory': '45MB'}},
+    'response_time_test': {'success': True, 'metrics': {'average_response': '150ms', 'max_response': '500ms'}},
+    'concurrent_operations_test': {'success': True, 'metrics': {'concurrent_users': 10, 'throughput': '100 ops/sec'}}
+}
+
+_SECURITY_RESULTS = {
+    'input_validation_test': {'success': True, 'vulnerabilities': []},
+    'file_security_test': {'success': True, 'vulnerabilities': []},
+    'encryption_test': {'success': True, 'vulnerabilities': []},
+    'access_control_test': {'success': True, 'vulnerabilities': []}
+}
+
+_ACCESSIBILITY_RESULTS = {
+    'keyboard_navigation_test': {'success': True, 'issues': []},
+    'screen_reader_compatibility_test': {'success': True, 'issues': []},
+    'high_contrast_test': {'success': True, 'issues': []},
+    'terminal_compatibility_test': {'success': True, 'issues': []}
+}
+
+
+def _preimport_all(suite_names: Iterable[str]) -> None:
+    """
+    Import every test module up front so later suite loads hit sys.modules.
+    
+    Args:
+        suite_names: Names of the test modules inside the tests package
+    """
+    for suite_name in suite_names:
+        try:
+            importlib.import_module(f"tests.{suite_name}")
+        except Exception as e:
+            # Reported again, per suite, when the suite is loaded
+            logger.warning("Could not pre-import %s: %s", suite_name, e)
+
+
+def _init_suite_worker(suite_names: Iterable[str], work_root: str) -> None:
+    """
+    Prepare a suite worker process: give it its own working directory and
+    pre-import the test modules.
+    
+    Suites write cwd-relative files such as data/analytics.json and
+    data/quiz_sessions.json, so workers sharing a cwd would overwrite each
+    other's state.
+    
+    Args:
+        suite_names: Names of the test modules inside the tests package
+        work_root: Directory to create the worker's working directory in
+    """
+    os.chdir(tempfile.mkdtemp(prefix='suite_worker_', dir=work_root))
+    # The tests package is imported from the project root, not the new cwd
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    _preimport_all(suite_names)
+
+
+def _iter_test_cases(suite: unittest.TestSuite) -> Iterable[unittest.TestCase]:
+    """Yield the individual test cases of a possibly nested suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_test_cases(test)
+        else:
+            yield test
+
+
+def _dump_json_bytes(value: Any) -> bytes:
+    """Serialize a results value (dict, dataclass or scalar) to indented UTF-8 JSON."""
+    # orjson serializes the phase result dataclasses natively
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if is_dataclass(value):
+        value = asdict(value)
+    return json.dumps(value, indent=2).encode('utf-8')
+
+
+async def _timed(awaitable) -> Tuple[Any, float]:
+    """
+    Await a scenario and measure how long it took.
+    
+    Args:
+        awaitable: Scenario coroutine to await
+        
+    Returns:
+        Tuple of (scenario result, elapsed seconds)
+    """
+    scenario_start = time.perf_counter()
+    result = await awaitable
+    return result, time.perf_counter() - scenario_start
+
+
+@functools.lru_cache(maxsize=None)
+def _load_suite(suite_name: str) -> Tuple[unittest.TestCase, ...]:
+    """
+    Load the test cases of a suite once per process.
+    
+    The cases are cached rather than the TestSuite itself because running a
+    suite releases its tests, so each run wraps them in a fresh TestSuite.
+    
+    Args:
+        suite_name: Name of the test module inside the tests package
+        
+    Returns:
+        Tuple of test cases in load order
+    """
+    module_name = f"tests.{suite_name}"
+    return tuple(_iter_test_cases(unittest.defaultTestLoader.loadTestsFromName(module_name)))
+
+
+@functools.lru_cache(maxsize=None)
+def _suite_runner() -> unittest.TextTestRunner:
+    """Return this process's TextTestRunner, created on first use and reused for every suite."""
+    return unittest.TextTestRunner(verbosity=0, stream=io.StringIO(), resultclass=unittest.TextTestResult)
+
+
+def _run_one_suite(suite_name: str) -> Dict[str, Any]:
+    """
+    Load and run a single unit test suite in a worker process.
+    
+    Args:
+        suite_name: Name of the test module inside the tests package
+        
+    Returns:
+        Plain, picklable counts for the suite run
+    """
+    suite_start = time.perf_counter()
+    
+    # Load (cached) and run test suite
+    suite = unittest.TestSuite(_load_suite(suite_name))
+    runner = _suite_runner()
+    result = runner.run(suite)
+    
+    # Output is not kept; empty the buffer so it does not grow across suites
+    runner.stream.seek(0)
+    runner.stream.truncate(0)
+    
+    # Count once here; these are the values shipped back to the parent
+    ran = result.testsRun
+    fails = len(result.failures)
+    errs = len(result.errors)
+    
+    return {
+        'tests_run': ran,
+        'tests_passed': ran - fails - errs,
+        'failures': fails,
+        'errors': errs,
+        'execution_time': time.perf_counter() - suite_start
+    }
+
+
+# Slotted result records where the interpreter supports it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class UnitResult:
+    """Aggregated results of the unit test phase."""
+    suites_run: int = 0
+    tests_run: int = 0
+    tests_passed: int = 0
+    tests_failed: int = 0
+    errors: int = 0
+    execution_time: float = 0.0
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ScenarioResult:
+    """Aggregated results of the integration test phase."""
+    scenarios_run: int = 0
+    scenarios_passed: int = 0
+    scenarios_failed: int = 0
+    execution_time: float = 0.0
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class WorkflowResult:
+    """Aggregated results of the end-to-end test phase."""
+    workflows_run: int = 0
+    workflows_passed: int = 0
+    workflows_failed: int = 0
+    execution_time: float = 0.0
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class PhaseResult:
+    """Aggregated results of the performance, security and accessibility phases."""
+    tests_run: int = 0
+    tests_passed: int = 0
+    tests_failed: int = 0
+    execution_time: float = 0.0
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
 class ComprehensiveTestRunner:
     """Comprehensive test runner for the entire application."""
     
-    def __init__(self):
-        """Initialize the test runner."""
+    def __init__(self, test_suites: Optional[Iterable[str]] = None,
+                 integration_scenarios: Optional[Iterable[str]] = None,
+                 e2e_workflows: Optional[Iterable[str]] = None,
+                 performance_scenarios: Optional[Iterable[str]] = None,
+                 security_scenarios: Optional[Iterable[str]] = None,
+                 accessibility_scenarios: Optional[Iterable[str]] = None):
+        """
+        Initialize the test runner.
+        
+        Each list defaults to the full set; pass an empty list to skip that phase.
+        
+        Args:
+            test_suites: Unit test modules to run
+            integration_scenarios: Integration scenarios to run
+            e2e_workflows: End-to-end workflows to run
+            performance_scenarios: Performance scenarios to run
+            security_scenarios: Security scenarios to run
+            accessibility_scenarios: Accessibility scenarios to run
+        """
         self.test_results = {}
         self.coverage_results = {}
         self.performance_results = {}
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
+        
+        # Measure coverage in-process (and in suite workers) while the phases run.
+        # Data files go to a private directory rather than the project root, and
+        # the settings come from pyproject.toml: multiprocessing measurement needs
+        # a config file the workers can read, wherever the runner is started from
+        self._coverage = None
+        self._coverage_dir = None
+        if COVERAGE_AVAILABLE:
+            try:
+                self._coverage_dir = tempfile.TemporaryDirectory(prefix='qc_coverage_')
+                self._coverage = coverage.Coverage(
+                    data_file=os.path.join(self._coverage_dir.name, '.coverage'),
+                    data_suffix=True,
+                    config_file=os.path.join(PROJECT_ROOT, 'pyproject.toml'),
+                    source=[os.path.join(PROJECT_ROOT, 'src')],
+                    concurrency=['thread', 'multiprocessing']
+                )
+            except Exception as e:
+                logger.warning("Coverage disabled: %s", e)
+                self._coverage = None
         
         # Test suites to run
-        self.test_suites = [
+        self.test_suites = list(test_suites) if test_suites is not None else [
             'test_models',
             'test_quiz_engine_phase_1_4',
             'test_data_persistence',
@@ -47,7 +332,7 @@ class ComprehensiveTestRunner:
         ]
         
         # Integration test scenarios
-        self.integration_scenarios = [
+        self.integration_scenarios = list(integration_scenarios) if integration_scenarios is not None else [
             'complete_user_workflow',
             'database_migration_workflow',
             'import_export_workflow',
@@ -55,6 +340,38 @@ class ComprehensiveTestRunner:
             'ocr_workflow'
         ]
         
+        # End-to-end workflows
+        self.e2e_workflows = list(e2e_workflows) if e2e_workflows is not None else [
+            'complete_quiz_workflow',
+            'question_management_workflow',
+            'analytics_workflow',
+            'import_export_workflow'
+        ]
+        
+        # Performance test scenarios
+        self.performance_scenarios = list(performance_scenarios) if performance_scenarios is not None else [
+            'large_dataset_handling',
+            'memory_usage_test',
+            'response_time_test',
+            'concurrent_operations_test'
+        ]
+        
+        # Security test scenarios
+        self.security_scenarios = list(security_scenarios) if security_scenarios is not None else [
+            'input_validation_test',
+            'file_security_test',
+            'encryption_test',
+            'access_control_test'
+        ]
+        
+        # Accessibility test scenarios
+        self.accessibility_scenarios = list(accessibility_scenarios) if accessibility_scenarios is not None else [
+            'keyboard_navigation_test',
+            'screen_reader_compatibility_test',
+            'high_contrast_test',
+            'terminal_compatibility_test'
+        ]
+        
         logger.info("Comprehensive test runner initialized")
     
     def run_all_tests(self) -> Dict[str, Any]:
@@ -66,29 +383,47 @@ class ComprehensiveTestRunner:
         """
         logger.info("Starting comprehensive test execution")
         
-        # Run unit tests
-        unit_results = self._run_unit_tests()
-        
-        # Run integration tests
-        integration_results = self._run_integration_tests()
-        
-        # Run end-to-end tests
-        e2e_results = self._run_end_to_end_tests()
-        
-        # Run performance tests
-        performance_results = self._run_performance_tests()
-        
-        # Run security tests
-        security_results = self._run_security_tests()
-        
-        # Run accessibility tests
-        accessibility_results = self._run_accessibility_tests()
-        
-        # Generate coverage report
+        # Run the independent test phases concurrently; each writes only its own results
+        phases = {
+            'unit_tests': self._run_unit_tests,
+            'integration_tests': self._run_integration_tests,
+            'end_to_end_tests': self._run_end_to_end_tests,
+            'performance_tests': self._run_performance_tests,
+            'security_tests': self._run_security_tests,
+            'accessibility_tests': self._run_accessibility_tests
+        }
+        phase_results = {}
+        
+        if self._coverage:
+            self._coverage.start()
+        with ThreadPoolExecutor(max_workers=len(phases)) as pool:
+            # Async phases get their own event loop on their worker thread
+            futures = {
+                (pool.submit(asyncio.run, run_phase()) if asyncio.iscoroutinefunction(run_phase)
+                 else pool.submit(run_phase)): name
+                for name, run_phase in phases.items()
+            }
+            for future in as_completed(futures):
+                phase_results[futures[future]] = future.result()
+        if self._coverage:
+            self._coverage.stop()
+            self._coverage.save()
+        
+        self.test_results = phase_results
+        unit_results = phase_results['unit_tests']
+        integration_results = phase_results['integration_tests']
+        e2e_results = phase_results['end_to_end_tests']
+        performance_results = phase_results['performance_tests']
+        security_results = phase_results['security_tests']
+        accessibility_results = phase_results['accessibility_tests']
+        
+        # Generate coverage report once every phase has finished
         coverage_results = self._generate_coverage_report()
+        if self._coverage_dir is not None:
+            self._coverage_dir.cleanup()
         
         # Compile comprehensive results
-        total_time = time.time() - self.start_time
+        total_time = time.perf_counter() - self.start_time
         
         results = {
             'execution_time': total_time,
@@ -105,375 +440,415 @@ class ComprehensiveTestRunner:
         # Save results
         self._save_test_results(results)
         
-        logger.info(f"Comprehensive testing completed in {total_time:.2f} seconds")
+        logger.info("Comprehensive testing completed in %.2f seconds", total_time)
         return results
     
-    def _run_unit_tests(self) -> Dict[str, Any]:
+    def _run_unit_tests(self) -> UnitResult:
         """Run all unit test suites."""
         logger.info("Running unit tests...")
         
-        unit_results = {
-            'suites_run': 0,
-            'tests_run': 0,
-            'tests_passed': 0,
-            'tests_failed': 0,
-            'errors': 0,
-            'execution_time': 0,
-            'details': {}
+        if not self.test_suites:
+            return UnitResult()
+        
+        start_time = time.perf_counter()
+        
+        # Collect per-suite results first and aggregate them once at the end
+        if XDIST_AVAILABLE and self._coverage is None:
+            per_suite, failed_suites = self._run_suites_xdist()
+        else:
+            # In-process coverage only follows multiprocessing workers
+            per_suite, failed_suites = self._run_suites_sharded()
+        
+        # Full details only for suites that need inspecting; passing suites stay compact
+        details = {
+            suite_name: {
+                'tests_run': result['tests_run'],
+                'failures': result['failures'],
+                'errors': result['errors'],
+                'execution_time': result['execution_time'],
+                'success_rate': result['tests_passed'] / result['tests_run'] * 100 if result['tests_run'] > 0 else 0
+            } if result['failures'] or result['errors'] else {
+                'tests_run': result['tests_run'],
+                'execution_time': result['execution_time']
+            }
+            for suite_name, result in per_suite
         }
+        details.update({
+            suite_name: {
+                'error': error,
+                'execution_time': 0,
+                'success_rate': 0
+            }
+            for suite_name, error in failed_suites
+        })
+        
+        return UnitResult(
+            suites_run=len(per_suite),
+            tests_run=sum(result['tests_run'] for _, result in per_suite),
+            tests_passed=sum(result['tests_passed'] for _, result in per_suite),
+            tests_failed=sum(result['failures'] for _, result in per_suite),
+            errors=sum(result['errors'] for _, result in per_suite) + len(failed_suites),
+            execution_time=time.perf_counter() - start_time,
+            details=details
+        )
+    
+    def _run_suites_sharded(self) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Tuple[str, str]]]:
+        """
+        Run each unit test suite as one task on a process pool.
         
-        start_time = time.time()
+        Returns:
+            Tuple of (suite name, counts) pairs and (suite name, error) pairs
+        """
+        per_suite = []
+        failed_suites = []
+        
+        # Suites are independent, so shard them across worker processes. This
+        # runs on a phase thread, and forking a threaded process can copy held
+        # locks into the child, so workers are spawned instead
+        max_workers = max((os.cpu_count() or 1) - 2, 1)
+        with tempfile.TemporaryDirectory(prefix='qc_suites_') as work_root, \
+                ProcessPoolExecutor(max_workers=max_workers,
+                                    mp_context=multiprocessing.get_context('spawn'),
+                                    initializer=_init_suite_worker,
+                                    initargs=(tuple(self.test_suites), work_root)) as pool:
+            futures = {}
+            for suite_name in self.test_suites:
+                logger.info("Running %s...", suite_name)
+                futures[pool.submit(_run_one_suite, suite_name)] = suite_name
+            
+            for future in as_completed(futures):
+                suite_name = futures[future]
+                try:
+                    result = future.result()
+                    per_suite.append((suite_name, result))
+                    logger.info("%s: %d tests, %d failures, %d errors",
+                                suite_name, result['tests_run'], result['failures'], result['errors'])
+                except Exception as e:
+                    logger.error("Error running %s: %s", suite_name, e)
+                    failed_suites.append((suite_name, str(e)))
+        
+        return per_suite, failed_suites
+    
+    def _run_suites_xdist(self) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Tuple[str, str]]]:
+        """
+        Run all unit test suites in one pytest-xdist session, sharded per test case.
         
-        for suite_name in self.test_suites:
-            try:
-                logger.info(f"Running {suite_name}...")
-                suite_start = time.time()
-                
-                # Import and run test suite
-                module_name = f"tests.{suite_name}"
-                suite = unittest.defaultTestLoader.loadTestsFromName(module_name)
-                runner = unittest.TextTestRunner(verbosity=0, stream=open(os.devnull, 'w'))
-                result = runner.run(suite)
-                
-                suite_time = time.time() - suite_start
-                
-                # Record results
-                unit_results['suites_run'] += 1
-                unit_results['tests_run'] += result.testsRun
-                unit_results['tests_passed'] += result.testsRun - len(result.failures) - len(result.errors)
-                unit_results['tests_failed'] += len(result.failures)
-                unit_results['errors'] += len(result.errors)
-                
-                unit_results['details'][suite_name] = {
-                    'tests_run': result.testsRun,
-                    'failures': len(result.failures),
-                    'errors': len(result.errors),
-                    'execution_time': suite_time,
-                    'success_rate': (result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100 if result.testsRun > 0 else 0
-                }
-                
-                logger.info(f"{suite_name}: {result.testsRun} tests, {len(result.failures)} failures, {len(result.errors)} errors")
-                
-            except Exception as e:
-                logger.error(f"Error running {suite_name}: {e}")
-                unit_results['errors'] += 1
-                unit_results['details'][suite_name] = {
-                    'error': str(e),
-                    'execution_time': 0,
-                    'success_rate': 0
-                }
+        Returns:
+            Tuple of (suite name, counts) pairs and (suite name, error) pairs
+        """
+        suite_names = set(self.test_suites)
+        per_suite_counts = {
+            suite_name: {'tests_run': 0, 'tests_passed': 0, 'failures': 0, 'errors': 0, 'execution_time': 0.0}
+            for suite_name in self.test_suites
+        }
         
-        unit_results['execution_time'] = time.time() - start_time
-        return unit_results
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, 'junit.xml')
+            command = [
+                sys.executable, '-m', 'pytest', '-q', '-n', 'auto', '-p', 'no:cacheprovider',
+                f'--junitxml={report_path}'
+            ] + [os.path.join('tests', f'{suite_name}.py') for suite_name in self.test_suites]
+            
+            logger.info("Running %d suites with pytest-xdist...", len(self.test_suites))
+            result = subprocess.run(command, capture_output=True, text=True, cwd=PROJECT_ROOT)
+            
+            if not os.path.exists(report_path):
+                error = (result.stderr or result.stdout).strip().splitlines()[-1:] or ['pytest produced no report']
+                return [], [(suite_name, error[0]) for suite_name in self.test_suites]
+            
+            tree = ET.parse(report_path)
+        
+        for testcase in tree.iter('testcase'):
+            # classname is "module.Class" (or dotted package path); collection errors only set name
+            parts = (testcase.get('classname') or testcase.get('name', '')).split('.')
+            suite_name = next((part for part in parts if part in suite_names), None)
+            if suite_name is None:
+                continue
+            
+            counts = per_suite_counts[suite_name]
+            outcomes = {child.tag for child in testcase}
+            counts['tests_run'] += 1
+            counts['execution_time'] += float(testcase.get('time', 0) or 0)
+            if 'failure' in outcomes:
+                counts['failures'] += 1
+            elif 'error' in outcomes:
+                counts['errors'] += 1
+            else:
+                # Skips count as passed, matching unittest's testsRun accounting
+                counts['tests_passed'] += 1
+        
+        per_suite = list(per_suite_counts.items())
+        for suite_name, counts in per_suite:
+            logger.info("%s: %d tests, %d failures, %d errors",
+                        suite_name, counts['tests_run'], counts['failures'], counts['errors'])
+        return per_suite, []
     
-    def _run_integration_tests(self) -> Dict[str, Any]:
+    async def _run_integration_tests(self) -> ScenarioResult:
         """Run integration tests."""
         logger.info("Running integration tests...")
         
-        integration_results = {
-            'scenarios_run': 0,
-            'scenarios_passed': 0,
-            'scenarios_failed': 0,
-            'execution_time': 0,
-            'details': {}
-        }
+        integration_results = ScenarioResult()
+        
+        if not self.integration_scenarios:
+            return integration_results
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         for scenario in self.integration_scenarios:
-            try:
-                logger.info(f"Running integration scenario: {scenario}")
-                scenario_start = time.time()
-                
-                # Run integration scenario
-                success = self._run_integration_scenario(scenario)
-                
-                scenario_time = time.time() - scenario_start
-                
-                integration_results['scenarios_run'] += 1
-                if success:
-                    integration_results['scenarios_passed'] += 1
-                else:
-                    integration_results['scenarios_failed'] += 1
-                
-                integration_results['details'][scenario] = {
-                    'success': success,
-                    'execution_time': scenario_time
-                }
-                
-                logger.info(f"{scenario}: {'PASSED' if success else 'FAILED'}")
-                
-            except Exception as e:
-                logger.error(f"Error running integration scenario {scenario}: {e}")
-                integration_results['scenarios_failed'] += 1
-                integration_results['details'][scenario] = {
+            logger.info("Running integration scenario: %s", scenario)
+        
+        # Run integration scenarios cooperatively
+        outcomes = await asyncio.gather(
+            *(_timed(self._run_integration_scenario(scenario)) for scenario in self.integration_scenarios),
+            return_exceptions=True
+        )
+        
+        for scenario, outcome in zip(self.integration_scenarios, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Error running integration scenario %s: %s", scenario, outcome)
+                integration_results.scenarios_failed += 1
+                integration_results.details[scenario] = {
                     'success': False,
-                    'error': str(e),
+                    'error': str(outcome),
                     'execution_time': 0
                 }
+                continue
+            
+            success, scenario_time = outcome
+            
+            integration_results.scenarios_run += 1
+            if success:
+                integration_results.scenarios_passed += 1
+            else:
+                integration_results.scenarios_failed += 1
+            
+            integration_results.details[scenario] = {
+                'success': success,
+                'execution_time': scenario_time
+            }
+            
+            logger.info("%s: %s", scenario, 'PASSED' if success else 'FAILED')
         
-        integration_results['execution_time'] = time.time() - start_time
+        integration_results.execution_time = time.perf_counter() - start_time
         return integration_results
     
-    def _run_end_to_end_tests(self) -> Dict[str, Any]:
+    async def _run_end_to_end_tests(self) -> WorkflowResult:
         """Run end-to-end tests."""
         logger.info("Running end-to-end tests...")
         
-        e2e_results = {
-            'workflows_run': 0,
-            'workflows_passed': 0,
-            'workflows_failed': 0,
-            'execution_time': 0,
-            'details': {}
-        }
+        e2e_results = WorkflowResult()
         
-        start_time = time.time()
+        if not self.e2e_workflows:
+            return e2e_results
         
-        # Define end-to-end workflows
-        workflows = [
-            'complete_quiz_workflow',
-            'question_management_workflow',
-            'analytics_workflow',
-            'import_export_workflow'
-        ]
+        start_time = time.perf_counter()
         
-        for workflow in workflows:
-            try:
-                logger.info(f"Running end-to-end workflow: {workflow}")
-                workflow_start = time.time()
-                
-                # Run end-to-end workflow
-                success = self._run_e2e_workflow(workflow)
-                
-                workflow_time = time.time() - workflow_start
-                
-                e2e_results['workflows_run'] += 1
-                if success:
-                    e2e_results['workflows_passed'] += 1
-                else:
-                    e2e_results['workflows_failed'] += 1
-                
-                e2e_results['details'][workflow] = {
-                    'success': success,
-                    'execution_time': workflow_time
-                }
-                
-                logger.info(f"{workflow}: {'PASSED' if success else 'FAILED'}")
-                
-            except Exception as e:
-                logger.error(f"Error running end-to-end workflow {workflow}: {e}")
-                e2e_results['workflows_failed'] += 1
-                e2e_results['details'][workflow] = {
+        for workflow in self.e2e_workflows:
+            logger.info("Running end-to-end workflow: %s", workflow)
+        
+        # Run end-to-end workflows cooperatively
+        outcomes = await asyncio.gather(
+            *(_timed(self._run_e2e_workflow(workflow)) for workflow in self.e2e_workflows),
+            return_exceptions=True
+        )
+        
+        for workflow, outcome in zip(self.e2e_workflows, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Error running end-to-end workflow %s: %s", workflow, outcome)
+                e2e_results.workflows_failed += 1
+                e2e_results.details[workflow] = {
                     'success': False,
-                    'error': str(e),
+                    'error': str(outcome),
                     'execution_time': 0
                 }
+                continue
+            
+            success, workflow_time = outcome
+            
+            e2e_results.workflows_run += 1
+            if success:
+                e2e_results.workflows_passed += 1
+            else:
+                e2e_results.workflows_failed += 1
+            
+            e2e_results.details[workflow] = {
+                'success': success,
+                'execution_time': workflow_time
+            }
+            
+            logger.info("%s: %s", workflow, 'PASSED' if success else 'FAILED')
         
-        e2e_results['execution_time'] = time.time() - start_time
+        e2e_results.execution_time = time.perf_counter() - start_time
         return e2e_results
     
-    def _run_performance_tests(self) -> Dict[str, Any]:
+    def _run_performance_tests(self) -> PhaseResult:
         """Run performance tests."""
         logger.info("Running performance tests...")
         
-        performance_results = {
-            'tests_run': 0,
-            'tests_passed': 0,
-            'tests_failed': 0,
-            'execution_time': 0,
-            'details': {}
-        }
+        performance_results = PhaseResult()
         
-        start_time = time.time()
+        if not self.performance_scenarios:
+            return performance_results
         
-        # Performance test scenarios
-        performance_scenarios = [
-            'large_dataset_handling',
-            'memory_usage_test',
-            'response_time_test',
-            'concurrent_operations_test'
-        ]
+        start_time = time.perf_counter()
         
-        for scenario in performance_scenarios:
+        for scenario in self.performance_scenarios:
             try:
-                logger.info(f"Running performance test: {scenario}")
-                test_start = time.time()
+                logger.info("Running performance test: %s", scenario)
+                test_start = time.perf_counter()
                 
                 # Run performance test
                 result = self._run_performance_test(scenario)
                 
-                test_time = time.time() - test_start
+                test_time = time.perf_counter() - test_start
                 
-                performance_results['tests_run'] += 1
+                performance_results.tests_run += 1
                 if result['success']:
-                    performance_results['tests_passed'] += 1
+                    performance_results.tests_passed += 1
                 else:
-                    performance_results['tests_failed'] += 1
+                    performance_results.tests_failed += 1
                 
-                performance_results['details'][scenario] = {
+                performance_results.details[scenario] = {
                     'success': result['success'],
                     'metrics': result.get('metrics', {}),
                     'execution_time': test_time
                 }
                 
-                logger.info(f"{scenario}: {'PASSED' if result['success'] else 'FAILED'}")
+                logger.info("%s: %s", scenario, 'PASSED' if result['success'] else 'FAILED')
                 
             except Exception as e:
-                logger.error(f"Error running performance test {scenario}: {e}")
-                performance_results['tests_failed'] += 1
-                performance_results['details'][scenario] = {
+                logger.error("Error running performance test %s: %s", scenario, e)
+                performance_results.tests_failed += 1
+                performance_results.details[scenario] = {
                     'success': False,
                     'error': str(e),
                     'execution_time': 0
                 }
         
-        performance_results['execution_time'] = time.time() - start_time
+        performance_results.execution_time = time.perf_counter() - start_time
         return performance_results
     
-    def _run_security_tests(self) -> Dict[str, Any]:
+    async def _run_security_tests(self) -> PhaseResult:
         """Run security tests."""
         logger.info("Running security tests...")
         
-        security_results = {
-            'tests_run': 0,
-            'tests_passed': 0,
-            'tests_failed': 0,
-            'execution_time': 0,
-            'details': {}
-        }
+        security_results = PhaseResult()
         
-        start_time = time.time()
+        if not self.security_scenarios:
+            return security_results
         
-        # Security test scenarios
-        security_scenarios = [
-            'input_validation_test',
-            'file_security_test',
-            'encryption_test',
-            'access_control_test'
-        ]
+        start_time = time.perf_counter()
         
-        for scenario in security_scenarios:
-            try:
-                logger.info(f"Running security test: {scenario}")
-                test_start = time.time()
-                
-                # Run security test
-                result = self._run_security_test(scenario)
-                
-                test_time = time.time() - test_start
-                
-                security_results['tests_run'] += 1
-                if result['success']:
-                    security_results['tests_passed'] += 1
-                else:
-                    security_results['tests_failed'] += 1
-                
-                security_results['details'][scenario] = {
-                    'success': result['success'],
-                    'vulnerabilities': result.get('vulnerabilities', []),
-                    'execution_time': test_time
-                }
-                
-                logger.info(f"{scenario}: {'PASSED' if result['success'] else 'FAILED'}")
-                
-            except Exception as e:
-                logger.error(f"Error running security test {scenario}: {e}")
-                security_results['tests_failed'] += 1
-                security_results['details'][scenario] = {
+        for scenario in self.security_scenarios:
+            logger.info("Running security test: %s", scenario)
+        
+        # Run security tests cooperatively
+        outcomes = await asyncio.gather(
+            *(_timed(self._run_security_test(scenario)) for scenario in self.security_scenarios),
+            return_exceptions=True
+        )
+        
+        for scenario, outcome in zip(self.security_scenarios, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Error running security test %s: %s", scenario, outcome)
+                security_results.tests_failed += 1
+                security_results.details[scenario] = {
                     'success': False,
-                    'error': str(e),
+                    'error': str(outcome),
                     'execution_time': 0
                 }
+                continue
+            
+            result, test_time = outcome
+            
+            security_results.tests_run += 1
+            if result['success']:
+                security_results.tests_passed += 1
+            else:
+                security_results.tests_failed += 1
+            
+            security_results.details[scenario] = {
+                'success': result['success'],
+                'vulnerabilities': result.get('vulnerabilities', []),
+                'execution_time': test_time
+            }
+            
+            logger.info("%s: %s", scenario, 'PASSED' if result['success'] else 'FAILED')
         
-        security_results['execution_time'] = time.time() - start_time
+        security_results.execution_time = time.perf_counter() - start_time
         return security_results
     
-    def _run_accessibility_tests(self) -> Dict[str, Any]:
+    async def _run_accessibility_tests(self) -> PhaseResult:
         """Run accessibility tests."""
         logger.info("Running accessibility tests...")
         
-        accessibility_results = {
-            'tests_run': 0,
-            'tests_passed': 0,
-            'tests_failed': 0,
-            'execution_time': 0,
-            'details': {}
-        }
+        accessibility_results = PhaseResult()
         
-        start_time = time.time()
+        if not self.accessibility_scenarios:
+            return accessibility_results
         
-        # Accessibility test scenarios
-        accessibility_scenarios = [
-            'keyboard_navigation_test',
-            'screen_reader_compatibility_test',
-            'high_contrast_test',
-            'terminal_compatibility_test'
-        ]
+        start_time = time.perf_counter()
         
-        for scenario in accessibility_scenarios:
-            try:
-                logger.info(f"Running accessibility test: {scenario}")
-                test_start = time.time()
-                
-                # Run accessibility test
-                result = self._run_accessibility_test(scenario)
-                
-                test_time = time.time() - test_start
-                
-                accessibility_results['tests_run'] += 1
-                if result['success']:
-                    accessibility_results['tests_passed'] += 1
-                else:
-                    accessibility_results['tests_failed'] += 1
-                
-                accessibility_results['details'][scenario] = {
-                    'success': result['success'],
-                    'accessibility_issues': result.get('issues', []),
-                    'execution_time': test_time
-                }
-                
-                logger.info(f"{scenario}: {'PASSED' if result['success'] else 'FAILED'}")
-                
-            except Exception as e:
-                logger.error(f"Error running accessibility test {scenario}: {e}")
-                accessibility_results['tests_failed'] += 1
-                accessibility_results['details'][scenario] = {
+        for scenario in self.accessibility_scenarios:
+            logger.info("Running accessibility test: %s", scenario)
+        
+        # Run accessibility tests cooperatively
+        outcomes = await asyncio.gather(
+            *(_timed(self._run_accessibility_test(scenario)) for scenario in self.accessibility_scenarios),
+            return_exceptions=True
+        )
+        
+        for scenario, outcome in zip(self.accessibility_scenarios, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Error running accessibility test %s: %s", scenario, outcome)
+                accessibility_results.tests_failed += 1
+                accessibility_results.details[scenario] = {
                     'success': False,
-                    'error': str(e),
+                    'error': str(outcome),
                     'execution_time': 0
                 }
+                continue
+            
+            result, test_time = outcome
+            
+            accessibility_results.tests_run += 1
+            if result['success']:
+                accessibility_results.tests_passed += 1
+            else:
+                accessibility_results.tests_failed += 1
+            
+            accessibility_results.details[scenario] = {
+                'success': result['success'],
+                'accessibility_issues': result.get('issues', []),
+                'execution_time': test_time
+            }
+            
+            logger.info("%s: %s", scenario, 'PASSED' if result['success'] else 'FAILED')
         
-        accessibility_results['execution_time'] = time.time() - start_time
+        accessibility_results.execution_time = time.perf_counter() - start_time
         return accessibility_results
     
     def _generate_coverage_report(self) -> Dict[str, Any]:
-        """Generate code coverage report."""
+        """Generate code coverage report from the data collected during the test phases."""
         logger.info("Generating coverage report...")
         
+        if self._coverage is None:
+            return {
+                'available': False,
+                'error': 'Coverage module not available',
+                'coverage_percentage': 0
+            }
+        
         try:
-            # Try to run coverage analysis
-            result = subprocess.run([
-                sys.executable, '-m', 'coverage', 'run', '--source=src', '-m', 'unittest', 'discover', 'tests'
-            ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
-            
-            if result.returncode == 0:
-                # Get coverage report
-                report_result = subprocess.run([
-                    sys.executable, '-m', 'coverage', 'report', '--show-missing'
-                ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
-                
-                coverage_data = {
-                    'available': True,
-                    'report': report_result.stdout,
-                    'coverage_percentage': self._extract_coverage_percentage(report_result.stdout)
-                }
-            else:
-                coverage_data = {
-                    'available': False,
-                    'error': 'Coverage module not available',
-                    'coverage_percentage': 0
-                }
-                
+            # Merge the data files written by the suite worker processes
+            self._coverage.combine()
+            report = io.StringIO()
+            coverage_percentage = self._coverage.report(file=report, show_missing=True)
+            coverage_data = {
+                'available': True,
+                'report': report.getvalue(),
+                'coverage_percentage': coverage_percentage
+            }
         except Exception as e:
             coverage_data = {
                 'available': False,
@@ -483,130 +858,79 @@ class ComprehensiveTestRunner:
         
         return coverage_data
     
-    def _extract_coverage_percentage(self, coverage_output: str) -> float:
-        """Extract coverage percentage from coverage report."""
-        try:
-            lines = coverage_output.split('\n')
-            for line in lines:
-                if 'TOTAL' in line and '%' in line:
-                    # Extract percentage from line like "TOTAL                   1234    123    90%"
-                    parts = line.split()
-                    for part in parts:
-                        if part.endswith('%'):
-                            return float(part[:-1])
-        except:
-            pass
-        return 0.0
-    
-    def _run_integration_scenario(self, scenario: str) -> bool:
+    async def _run_integration_scenario(self, scenario: str) -> bool:
         """Run a specific integration scenario."""
         # Mock implementation - in real scenario, this would test actual integration
-        if scenario == 'complete_user_workflow':
-            return True
-        elif scenario == 'database_migration_workflow':
-            return True
-        elif scenario == 'import_export_workflow':
-            return True
-        elif scenario == 'analytics_workflow':
-            return True
-        elif scenario == 'ocr_workflow':
-            return True
-        return False
+        return _INTEGRATION_RESULTS.get(scenario, False)
     
-    def _run_e2e_workflow(self, workflow: str) -> bool:
+    async def _run_e2e_workflow(self, workflow: str) -> bool:
         """Run a specific end-to-end workflow."""
         # Mock implementation - in real scenario, this would test actual workflows
-        if workflow == 'complete_quiz_workflow':
-            return True
-        elif workflow == 'question_management_workflow':
-            return True
-        elif workflow == 'analytics_workflow':
-            return True
-        elif workflow == 'import_export_workflow':
-            return True
-        return False
+        return _E2E_RESULTS.get(workflow, False)
     
     def _run_performance_test(self, test: str) -> Dict[str, Any]:
         """Run a specific performance test."""
         # Mock implementation - in real scenario, this would test actual performance
-        if test == 'large_dataset_handling':
-            return {'success': True, 'metrics': {'memory_usage': '50MB', 'processing_time': '2.5s'}}
-        elif test == 'memory_usage_test':
-            return {'success': True, 'metrics': {'peak_memory': '75MB', 'average_memory': '45MB'}}
-        elif test == 'response_time_test':
-            return {'success': True, 'metrics': {'average_response': '150ms', 'max_response': '500ms'}}
-        elif test == 'concurrent_operations_test':
-            return {'success': True, 'metrics': {'concurrent_users': 10, 'throughput': '100 ops/sec'}}
-        return {'success': False, 'metrics': {}}
+        return _PERF_RESULTS.get(test, {'success': False, 'metrics': {}})
     
-    def _run_security_test(self, test: str) -> Dict[str, Any]:
+    async def _run_security_test(self, test: str) -> Dict[str, Any]:
         """Run a specific security test."""
         # Mock implementation - in real scenario, this would test actual security
-        if test == 'input_validation_test':
-            return {'success': True, 'vulnerabilities': []}
-        elif test == 'file_security_test':
-            return {'success': True, 'vulnerabilities': []}
-        elif test == 'encryption_test':
-            return {'success': True, 'vulnerabilities': []}
-        elif test == 'access_control_test':
-            return {'success': True, 'vulnerabilities': []}
-        return {'success': False, 'vulnerabilities': ['Test failed']}
+        return _SECURITY_RESULTS.get(test, {'success': False, 'vulnerabilities': ['Test failed']})
     
-    def _run_accessibility_test(self, test: str) -> Dict[str, Any]:
+    async def _run_accessibility_test(self, test: str) -> Dict[str, Any]:
         """Run a specific accessibility test."""
         # Mock implementation - in real scenario, this would test actual accessibility
-        if test == 'keyboard_navigation_test':
-            return {'success': True, 'issues': []}
-        elif test == 'screen_reader_compatibility_test':
-            return {'success': True, 'issues': []}
-        elif test == 'high_contrast_test':
-            return {'success': True, 'issues': []}
-        elif test == 'terminal_compatibility_test':
-            return {'success': True, 'issues': []}
-        return {'success': False, 'issues': ['Accessibility issue found']}
+        return _ACCESSIBILITY_RESULTS.get(test, {'success': False, 'issues': ['Accessibility issue found']})
     
-    def _generate_summary(self, unit_results: Dict, integration_results: Dict, e2e_results: Dict, coverage_results: Dict) -> Dict[str, Any]:
+    def _generate_summary(self, unit_results: UnitResult, integration_results: ScenarioResult, e2e_results: WorkflowResult, coverage_results: Dict) -> Dict[str, Any]:
         """Generate test summary."""
-        total_tests = unit_results['tests_run'] + integration_results['scenarios_run'] + e2e_results['workflows_run']
-        total_passed = unit_results['tests_passed'] + integration_results['scenarios_passed'] + e2e_results['workflows_passed']
-        total_failed = unit_results['tests_failed'] + integration_results['scenarios_failed'] + e2e_results['workflows_failed']
+        coverage_percentage = coverage_results.get('coverage_percentage', 0) or 0
+        
+        total_tests = unit_results.tests_run + integration_results.scenarios_run + e2e_results.workflows_run
+        total_passed = unit_results.tests_passed + integration_results.scenarios_passed + e2e_results.workflows_passed
+        total_failed = unit_results.tests_failed + integration_results.scenarios_failed + e2e_results.workflows_failed
         
-        success_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
+        success_rate = total_passed * 100.0 / total_tests if total_tests else 0.0
+        passed = success_rate >= 90.0 and coverage_percentage >= 80.0
         
         return {
             'total_tests': total_tests,
             'total_passed': total_passed,
             'total_failed': total_failed,
             'success_rate': success_rate,
-            'coverage_percentage': coverage_results.get('coverage_percentage', 0),
-            'overall_status': 'PASS' if success_rate >= 90 and coverage_results.get('coverage_percentage', 0) >= 80 else 'FAIL'
+            'coverage_percentage': coverage_percentage,
+            'overall_status': 'PASS' if passed else 'FAIL'
         }
     
     def _save_test_results(self, results: Dict[str, Any]) -> None:
         """Save test results to file."""
         try:
             results_file = Path(__file__).parent / 'test_results_comprehensive.json'
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, default=str)
-            logger.info(f"Test results saved to {results_file}")
+            with open(results_file, 'wb') as f:
+                f.write(_dump_json_bytes(results))
+            logger.info("Test results saved to %s", results_file)
         except Exception as e:
-            logger.error(f"Error saving test results: {e}")
+            logger.error("Error saving test results: %s", e)
     
     def print_summary(self, results: Dict[str, Any]) -> None:
         """Print test summary."""
         summary = results['summary']
         
-        print("\n" + "="*80)
-        print("                    COMPREHENSIVE TEST RESULTS")
-        print("="*80)
-        print(f"Total Tests: {summary['total_tests']}")
-        print(f"Passed: {summary['total_passed']}")
-        print(f"Failed: {summary['total_failed']}")
-        print(f"Success Rate: {summary['success_rate']:.1f}%")
-        print(f"Code Coverage: {summary['coverage_percentage']:.1f}%")
-        print(f"Overall Status: {summary['overall_status']}")
-        print(f"Execution Time: {results['execution_time']:.2f} seconds")
-        print("="*80)
+        rule = "=" * 80
+        sys.stdout.write(
+            f"\n{rule}\n"
+            "                    COMPREHENSIVE TEST RESULTS\n"
+            f"{rule}\n"
+            f"Total Tests: {summary['total_tests']}\n"
+            f"Passed: {summary['total_passed']}\n"
+            f"Failed: {summary['total_failed']}\n"
+            f"Success Rate: {summary['success_rate']:.1f}%\n"
+            f"Code Coverage: {summary['coverage_percentage']:.1f}%\n"
+            f"Overall Status: {summary['overall_status']}\n"
+            f"Execution Time: {results['execution_time']:.2f} seconds\n"
+            f"{rule}\n"
+        )
 
 
 def main():
@@ -9,130 +9,253 @@ import unittest
 import sys
 import os
 import tempfile
-import shutil
 import json
-from unittest.mock import Mock, patch, MagicMock
+import logging
+import re
 from pathlib import Path
+from urllib.parse import urlsplit
 
 # Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from models.question import Question
 from models.tag import Tag
 from models.quiz_session import QuizSession
-from quiz_engine import QuizEngine
 from question_manager import QuestionManager
 from tag_manager import TagManager
-from data_persistence import DataPersistence
 
-class SecurityTestSuite(unittest.TestCase):
-    """Comprehensive security test suite."""
+logger = logging.getLogger(__name__)
+
+# orjson imports (optional, stdlib json is used without it)
+try:
+    import orjson
+    _loads = orjson.loads
+    _DecodeError = orjson.JSONDecodeError
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    _DecodeError = json.JSONDecodeError
+
+# UI imports (optional, dependent accessibility tests are skipped without them)
+try:
+    from ui.enhanced_console import EnhancedConsole
+    _HAS_CONSOLE = True
+except ImportError:
+    EnhancedConsole = None
+    _HAS_CONSOLE = False
+
+try:
+    from ui.user_preferences import UserPreferences
+    _HAS_PREFERENCES = True
+except ImportError:
+    UserPreferences = None
+    _HAS_PREFERENCES = False
+
+try:
+    from ui.command_history import CommandHistory
+    _HAS_HISTORY = True
+except ImportError:
+    CommandHistory = None
+    _HAS_HISTORY = False
+
+# Cryptography imports (optional, the encryption test is skipped without them)
+try:
+    from cryptography.fernet import Fernet
+    _FERNET = Fernet(Fernet.generate_key())
+except ImportError:
+    Fernet = None
+    _FERNET = None
+
+# Valid answers and tags shared by every Question built below, so only the
+# question text under test can fail validation
+_ANSWERS = (
+    {"text": "A", "is_correct": True},
+    {"text": "B", "is_correct": False},
+)
+_TAGS = ("security",)
+
+
+def _question(text):
+    """Build a multiple-choice Question around text; Question validates in __init__."""
+    return Question(text, "multiple_choice", [dict(answer) for answer in _ANSWERS], list(_TAGS))
+
+# Shared inputs, built once at import instead of in every test run
+_MALICIOUS_INPUTS = (
+    "'; DROP TABLE questions; --",
+    "1' OR '1'='1",
+    "<script>alert('XSS')</script>",
+    "../../../etc/passwd",
+    "null\0byte",
+    "very_long_string" * 1000
+)
+
+_MALICIOUS_PATHS = (
+    "../../../etc/passwd",
+    "..\\..\\..\\windows\\system32\\config\\sam",
+    "/etc/shadow",
+    "C:\\Windows\\System32\\config\\SAM"
+)
+
+_MALICIOUS_URLS = (
+    "http://malicious-site.com/exploit.exe",
+    "ftp://evil.com/backdoor",
+    "file:///etc/passwd",
+    "javascript:alert('XSS')"
+)
+
+# Malformed JSON documents; every one must be rejected by the parser
+_MALFORMED_JSON = (
+    b'{"question": "test", "answers": [}',  # unbalanced brackets
+    b'{"bp": 128/68}',  # unquoted expression
+    b'{"a": 1 "b": 2}',  # missing delimiter
+    b'{"x": "y"}{"z": 1}',  # multiple top-level values
+    b'{"s": "unterminated',  # unterminated string
+    b'{"c": "tab\there"}',  # unescaped control character
+    b"{'single': 1}",  # single-quoted key
+    b'{"n": 01}',  # leading zero
+)
+
+# URL schemes allowed by _is_safe_url and host names it rejects
+_SAFE_SCHEMES = frozenset({"http", "https"})
+_BLOCK_HOSTS_RE = re.compile(r"malicious|evil|exploit|backdoor", re.I)
+
+# Keyboard shortcuts exercised by the accessibility suite
+_SHORTCUTS = frozenset({"ctrl+h", "ctrl+q", "ctrl+n", "ctrl+t", "f1", "f2", "f3"})
+
+# Question text limit; sizes straddle it, then go well past it. Each pair is
+# (length, accepted), and texts are built per check so only one is alive at a time
+_LARGE_INPUT_SIZES = (
+    (Question.MAX_TEXT_LEN - 1, True),
+    (Question.MAX_TEXT_LEN, True),
+    (Question.MAX_TEXT_LEN + 1, False),
+    (100000, False),  # 100KB
+    (1000000, False),  # 1MB
+)
+
+# Unicode texts paired with their UTF-8 encoding, encoded once at import. Each
+# is a full question so it clears Question's 10-character minimum
+_UNICODE = tuple((text, text.encode("utf-8")) for text in (
+    "Question with émojis 🎯 and special chars: ñáéíóú",
+    "这是一个中文测试问题吗？",
+    "ما هي عاصمة فرنسا؟",
+    "Какая столица Франции?",
+    "מהי בירת צרפת?"
+))
+
+class _SandboxedTestCase(unittest.TestCase):
+    """Base for suites that work inside one temporary root per class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the temporary root shared by every test in the suite."""
+        super().setUpClass()
+        cls._tmp = tempfile.TemporaryDirectory(prefix="qc_sec_")
+        cls.addClassCleanup(cls._tmp.cleanup)
+        cls.temp_dir = cls._tmp.name
     
     def setUp(self):
-        """Set up security test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = os.path.join(self.temp_dir, 'data')
+        """Give each test its own data directory inside the shared temp root."""
+        self.data_dir = os.path.join(self.temp_dir, self._testMethodName)
         os.makedirs(self.data_dir, exist_ok=True)
+
+
+class SecurityTestSuite(_SandboxedTestCase):
+    """Comprehensive security test suite."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up security test fixtures shared by every test."""
+        super().setUpClass()
+        shared_data_dir = os.path.join(cls.temp_dir, 'data')
+        os.makedirs(shared_data_dir, exist_ok=True)
         
         # Initialize components
-        self.question_manager = QuestionManager(self.data_dir)
-        self.tag_manager = TagManager(self.data_dir)
-        self.quiz_engine = QuizEngine(self.question_manager, self.tag_manager)
-        self.data_persistence = DataPersistence(self.data_dir)
-    
-    def tearDown(self):
-        """Clean up security test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        cls.question_manager = QuestionManager(shared_data_dir)
+        cls.tag_manager = TagManager(shared_data_dir)
     
     def test_input_validation_security(self):
         """Test input validation for security vulnerabilities."""
-        print("\n=== Input Validation Security Test ===")
+        logger.debug("=== Input Validation Security Test ===")
+        
+        # Values stored by accepted inputs, type-checked once after the loops
+        stored = []
         
         # Test SQL injection attempts
-        malicious_inputs = [
-            "'; DROP TABLE questions; --",
-            "1' OR '1'='1",
-            "<script>alert('XSS')</script>",
-            "../../../etc/passwd",
-            "null\0byte",
-            "very_long_string" * 1000
-        ]
-        
-        for malicious_input in malicious_inputs:
+        for malicious_input in _MALICIOUS_INPUTS:
             # Test question text validation
-            try:
-                question = Question(malicious_input, "multiple_choice", ["A", "B"], [0])
-                # Should not raise exception, but should sanitize input
-                self.assertIsInstance(question.question_text, str)
-            except ValueError:
-                # Expected for some malicious inputs
-                pass
+            with self.subTest(model='question', input=malicious_input[:40]):
+                try:
+                    question = _question(malicious_input)
+                    # Should not raise exception, but should sanitize input
+                    stored.append(question.question_text)
+                except ValueError:
+                    # Expected for some malicious inputs
+                    pass
         
         # Test tag name validation
-        for malicious_input in malicious_inputs:
-            try:
-                tag = Tag(malicious_input, "description")
-                # Should not raise exception, but should sanitize input
-                self.assertIsInstance(tag.name, str)
-            except ValueError:
-                # Expected for some malicious inputs
-                pass
+        for malicious_input in _MALICIOUS_INPUTS:
+            with self.subTest(model='tag', input=malicious_input[:40]):
+                try:
+                    tag = Tag(malicious_input, "description")
+                    # Should not raise exception, but should sanitize input
+                    stored.append(tag.name)
+                except ValueError:
+                    # Expected for some malicious inputs
+                    pass
+        
+        self.assertEqual([value for value in stored if type(value) is not str], [])
     
     def test_file_security(self):
         """Test file security and path traversal protection."""
-        print("\n=== File Security Test ===")
-        
-        # Test path traversal attempts
-        malicious_paths = [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32\\config\\sam",
-            "/etc/shadow",
-            "C:\\Windows\\System32\\config\\SAM"
-        ]
-        
-        for malicious_path in malicious_paths:
-            try:
-                # Test file operations with malicious paths
-                test_file = os.path.join(self.temp_dir, malicious_path)
+        logger.debug("=== File Security Test ===")
+        
+        # Test path traversal attempts by resolving each path, never opening it
+        sandbox_root = os.path.realpath(self.temp_dir)
+        for malicious_path in _MALICIOUS_PATHS:
+            test_file = os.path.join(self.temp_dir, malicious_path)
+            parts = Path(malicious_path)
+            # Only '..' components or an absolute/drive anchor can leave the sandbox
+            is_traversal = '..' in parts.parts or bool(parts.anchor)
+            
+            with self.subTest(path=malicious_path):
+                try:
+                    resolved = os.path.realpath(test_file)
+                except OSError:
+                    # Unresolvable paths must at least carry no parent references
+                    self.assertNotIn('..', Path(test_file).parts)
+                    continue
                 
-                # Should not allow access to system files
-                with self.assertRaises((OSError, ValueError, PermissionError)):
-                    with open(test_file, 'w') as f:
-                        f.write("test")
-            except Exception:
-                # Expected for malicious paths
-                pass
+                try:
+                    escapes = os.path.commonpath([sandbox_root, resolved]) != sandbox_root
+                except ValueError:
+                    # Different drives on Windows
+                    escapes = True
+                self.assertEqual(escapes, is_traversal,
+                                 f"Containment check disagrees for {malicious_path} -> {resolved}")
     
+    @unittest.skipUnless(_FERNET is not None, "cryptography not installed")
     def test_data_encryption(self):
         """Test data encryption and security."""
-        print("\n=== Data Encryption Test ===")
+        logger.debug("=== Data Encryption Test ===")
         
-        try:
-            # Test encryption availability
-            from cryptography.fernet import Fernet
-            
-            # Test encryption/decryption
-            key = Fernet.generate_key()
-            fernet = Fernet(key)
-            
-            test_data = "Sensitive quiz data"
-            encrypted_data = fernet.encrypt(test_data.encode())
-            decrypted_data = fernet.decrypt(encrypted_data).decode()
-            
-            self.assertEqual(test_data, decrypted_data)
-            self.assertNotEqual(test_data, encrypted_data)
-            
-            print("Encryption/decryption working correctly")
-            
-        except ImportError:
-            print("Encryption module not available, skipping encryption test")
+        # Test encryption/decryption with the shared module-level key
+        test_data = "Sensitive quiz data"
+        encrypted_data = _FERNET.encrypt(test_data.encode())
+        decrypted_data = _FERNET.decrypt(encrypted_data).decode()
+        
+        self.assertEqual(test_data, decrypted_data)
+        self.assertNotEqual(test_data, encrypted_data)
+        
+        logger.debug("Encryption/decryption working correctly")
     
     def test_access_control(self):
         """Test access control and permissions."""
-        print("\n=== Access Control Test ===")
+        logger.debug("=== Access Control Test ===")
         
         # Test file permissions
-        test_file = os.path.join(self.temp_dir, 'test_permissions.txt')
+        test_file = os.path.join(self.data_dir, 'test_permissions.txt')
         
         try:
             # Create file with restricted permissions
@@ -153,27 +276,23 @@ class SecurityTestSuite(unittest.TestCase):
             self.assertEqual(data, "updated data")
             
         except PermissionError:
-            print("Permission test failed - expected on some systems")
+            logger.debug("Permission test failed - expected on some systems")
     
     def test_data_validation(self):
         """Test data validation for security."""
-        print("\n=== Data Validation Security Test ===")
+        logger.debug("=== Data Validation Security Test ===")
         
         # Test with malformed JSON
-        malformed_json = '{"question": "test", "answers": [}'
-        
-        try:
-            json.loads(malformed_json)
-            self.fail("Should have raised JSONDecodeError")
-        except json.JSONDecodeError:
-            # Expected
-            pass
+        for malformed_json in _MALFORMED_JSON:
+            with self.subTest(document=malformed_json):
+                with self.assertRaises(_DecodeError):
+                    _loads(malformed_json)
         
         # Test with oversized data
         oversized_data = "A" * 1000000  # 1MB
         
         try:
-            question = Question(oversized_data, "multiple_choice", ["A", "B"], [0])
+            question = _question(oversized_data)
             # Should handle oversized data gracefully
             self.assertIsInstance(question.question_text, str)
         except (ValueError, MemoryError):
@@ -182,362 +301,262 @@ class SecurityTestSuite(unittest.TestCase):
     
     def test_network_security(self):
         """Test network security (for OCR and import features)."""
-        print("\n=== Network Security Test ===")
+        logger.debug("=== Network Security Test ===")
         
         # Test with malicious URLs
-        malicious_urls = [
-            "http://malicious-site.com/exploit.exe",
-            "ftp://evil.com/backdoor",
-            "file:///etc/passwd",
-            "javascript:alert('XSS')"
-        ]
-        
-        for malicious_url in malicious_urls:
+        for malicious_url in _MALICIOUS_URLS:
             # Should not process malicious URLs
             self.assertFalse(self._is_safe_url(malicious_url))
     
     def test_memory_security(self):
         """Test memory security and buffer overflow protection."""
-        print("\n=== Memory Security Test ===")
-        
-        # Test with very large inputs
-        large_inputs = [
-            "A" * 100000,  # 100KB
-            "B" * 1000000,  # 1MB
-            "C" * 10000000  # 10MB
-        ]
-        
-        for large_input in large_inputs:
-            try:
-                question = Question(large_input, "multiple_choice", ["A", "B"], [0])
-                # Should handle large inputs without crashing
-                self.assertIsInstance(question.question_text, str)
-            except (ValueError, MemoryError):
-                # Expected for very large inputs
-                pass
+        logger.debug("=== Memory Security Test ===")
+        
+        # Texts up to the limit are stored intact, longer ones are rejected
+        for size, accepted in _LARGE_INPUT_SIZES:
+            with self.subTest(size=size):
+                large_input = "A" * size
+                if accepted:
+                    self.assertEqual(_question(large_input).question_text, large_input)
+                else:
+                    with self.assertRaises(ValueError):
+                        _question(large_input)
+        
+        # 10MB probe, only materialized with RUN_HEAVY_TESTS set and freed right after
+        if os.environ.get("RUN_HEAVY_TESTS"):
+            with self.subTest(size=10000000):
+                huge_input = "C" * 10000000
+                try:
+                    with self.assertRaises(ValueError):
+                        _question(huge_input)
+                except MemoryError:
+                    pass
+                finally:
+                    del huge_input
     
     def _is_safe_url(self, url: str) -> bool:
         """Check if URL is safe (mock implementation)."""
-        safe_protocols = ['http:', 'https:']
-        dangerous_patterns = ['malicious', 'evil', 'exploit', 'backdoor']
-        
-        if not any(url.startswith(protocol) for protocol in safe_protocols):
+        try:
+            parts = urlsplit(url)
+        except ValueError:
             return False
         
-        if any(pattern in url.lower() for pattern in dangerous_patterns):
+        if parts.scheme not in _SAFE_SCHEMES:
             return False
         
-        return True
+        return _BLOCK_HOSTS_RE.search(parts.netloc) is None
 
 
-class AccessibilityTestSuite(unittest.TestCase):
+class AccessibilityTestSuite(_SandboxedTestCase):
     """Comprehensive accessibility test suite."""
     
-    def setUp(self):
-        """Set up accessibility test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = os.path.join(self.temp_dir, 'data')
-        os.makedirs(self.data_dir, exist_ok=True)
-    
-    def tearDown(self):
-        """Clean up accessibility test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
+    @unittest.skipUnless(_HAS_CONSOLE, "enhanced_console unavailable")
     def test_keyboard_navigation(self):
         """Test keyboard navigation accessibility."""
-        print("\n=== Keyboard Navigation Test ===")
+        logger.debug("=== Keyboard Navigation Test ===")
         
-        try:
-            from ui.enhanced_console import EnhancedConsole
-            
-            console = EnhancedConsole(self.data_dir)
-            
-            # Test keyboard shortcuts
-            shortcuts = [
-                'ctrl+h', 'ctrl+q', 'ctrl+n', 'ctrl+t',
-                'f1', 'f2', 'f3'
-            ]
-            
-            for shortcut in shortcuts:
-                result = console.handle_keyboard_shortcuts(shortcut)
-                # Should handle shortcuts without errors
-                self.assertIsInstance(result, bool)
-            
-            print("Keyboard navigation working correctly")
-            
-        except ImportError:
-            print("Enhanced console module not available, skipping keyboard navigation test")
+        console = EnhancedConsole(self.data_dir)
+        
+        # Test keyboard shortcuts
+        results = [console.handle_keyboard_shortcuts(shortcut) for shortcut in _SHORTCUTS]
+        # Should handle shortcuts without errors
+        self.assertEqual([result for result in results if type(result) is not bool], [])
+        
+        logger.debug("Keyboard navigation working correctly")
     
+    @unittest.skipUnless(_HAS_CONSOLE, "enhanced_console unavailable")
     def test_screen_reader_compatibility(self):
         """Test screen reader compatibility."""
-        print("\n=== Screen Reader Compatibility Test ===")
+        logger.debug("=== Screen Reader Compatibility Test ===")
         
-        try:
-            from ui.enhanced_console import EnhancedConsole
-            
-            console = EnhancedConsole(self.data_dir)
-            
-            # Test accessibility features
-            console.enable_accessibility_features(True)
-            self.assertTrue(console.accessibility_enabled)
-            
-            # Test help system
-            help_info = console.get_context_help('main')
-            self.assertIsInstance(help_info, dict)
-            self.assertIn('title', help_info)
-            
-            print("Screen reader compatibility working correctly")
-            
-        except ImportError:
-            print("Enhanced console module not available, skipping screen reader test")
+        console = EnhancedConsole(self.data_dir)
+        
+        # Test accessibility features
+        console.enable_accessibility_features(True)
+        self.assertTrue(console.accessibility_enabled)
+        
+        # Test help system
+        help_info = console.get_context_help('main')
+        self.assertIsInstance(help_info, dict)
+        self.assertIn('title', help_info)
+        
+        logger.debug("Screen reader compatibility working correctly")
     
+    @unittest.skipUnless(_HAS_PREFERENCES, "user_preferences unavailable")
     def test_high_contrast_support(self):
         """Test high contrast theme support."""
-        print("\n=== High Contrast Support Test ===")
+        logger.debug("=== High Contrast Support Test ===")
         
-        try:
-            from ui.user_preferences import UserPreferences
-            
-            prefs = UserPreferences(self.data_dir)
-            
-            # Test high contrast theme
-            result = prefs.set_theme('high_contrast')
-            self.assertTrue(result)
-            
-            # Test theme configuration
-            theme = prefs.get_theme('high_contrast')
-            self.assertIsInstance(theme, dict)
-            self.assertIn('colors', theme)
-            
-            print("High contrast support working correctly")
-            
-        except ImportError:
-            print("User preferences module not available, skipping high contrast test")
+        prefs = UserPreferences(self.data_dir)
+        
+        # Test high contrast theme
+        result = prefs.set_theme('high_contrast')
+        self.assertTrue(result)
+        
+        # Test theme configuration
+        theme = prefs.get_theme('high_contrast')
+        self.assertIsInstance(theme, dict)
+        self.assertIn('colors', theme)
+        
+        logger.debug("High contrast support working correctly")
     
+    @unittest.skipUnless(_HAS_CONSOLE, "enhanced_console unavailable")
     def test_terminal_compatibility(self):
         """Test terminal compatibility."""
-        print("\n=== Terminal Compatibility Test ===")
+        logger.debug("=== Terminal Compatibility Test ===")
         
-        try:
-            from ui.enhanced_console import EnhancedConsole
-            
-            console = EnhancedConsole(self.data_dir)
-            
-            # Test terminal capabilities
-            capabilities = console.validate_terminal_capabilities()
-            self.assertIsInstance(capabilities, dict)
-            self.assertIn('platform', capabilities)
-            self.assertIn('width', capabilities)
-            self.assertIn('height', capabilities)
-            
-            # Test UI adaptation
-            console.adapt_ui_to_terminal()
-            
-            print("Terminal compatibility working correctly")
-            
-        except ImportError:
-            print("Enhanced console module not available, skipping terminal compatibility test")
+        console = EnhancedConsole(self.data_dir)
+        
+        # Test terminal capabilities
+        capabilities = console.validate_terminal_capabilities()
+        self.assertIsInstance(capabilities, dict)
+        self.assertIn('platform', capabilities)
+        self.assertIn('width', capabilities)
+        self.assertIn('height', capabilities)
+        
+        # Test UI adaptation
+        console.adapt_ui_to_terminal()
+        
+        logger.debug("Terminal compatibility working correctly")
     
     def test_unicode_support(self):
         """Test Unicode character support."""
-        print("\n=== Unicode Support Test ===")
+        logger.debug("=== Unicode Support Test ===")
         
         # Test with Unicode characters
-        unicode_texts = [
-            "Question with émojis 🎯 and special chars: ñáéíóú",
-            "中文问题",
-            "العربية",
-            "Русский",
-            "עברית"
-        ]
-        
-        for unicode_text in unicode_texts:
-            try:
-                question = Question(unicode_text, "multiple_choice", ["A", "B"], [0])
-                self.assertEqual(question.question_text, unicode_text)
-            except UnicodeEncodeError:
-                print(f"Unicode encoding issue with: {unicode_text}")
+        for unicode_text, encoded in _UNICODE:
+            with self.subTest(text=unicode_text):
+                try:
+                    question = _question(unicode_text)
+                    self.assertEqual(question.question_text, unicode_text)
+                    # Stored text must round-trip to the same UTF-8 bytes
+                    self.assertEqual(question.question_text.encode("utf-8"), encoded)
+                except UnicodeEncodeError:
+                    logger.debug("Unicode encoding issue with: %s", unicode_text)
     
+    @unittest.skipUnless(_HAS_PREFERENCES, "user_preferences unavailable")
     def test_color_blind_support(self):
         """Test color blind support."""
-        print("\n=== Color Blind Support Test ===")
+        logger.debug("=== Color Blind Support Test ===")
         
-        try:
-            from ui.user_preferences import UserPreferences
-            
-            prefs = UserPreferences(self.data_dir)
-            
-            # Test monochrome theme
-            result = prefs.set_theme('monochrome')
-            self.assertTrue(result)
-            
-            # Test theme colors
-            theme = prefs.get_theme('monochrome')
-            self.assertIsInstance(theme, dict)
-            
-            print("Color blind support working correctly")
-            
-        except ImportError:
-            print("User preferences module not available, skipping color blind test")
+        prefs = UserPreferences(self.data_dir)
+        
+        # Test monochrome theme
+        result = prefs.set_theme('monochrome')
+        self.assertTrue(result)
+        
+        # Test theme colors
+        theme = prefs.get_theme('monochrome')
+        self.assertIsInstance(theme, dict)
+        
+        logger.debug("Color blind support working correctly")
     
+    @unittest.skipUnless(_HAS_HISTORY, "command_history unavailable")
     def test_motor_disability_support(self):
         """Test motor disability support."""
-        print("\n=== Motor Disability Support Test ===")
+        logger.debug("=== Motor Disability Support Test ===")
         
-        try:
-            from ui.command_history import CommandHistory
-            
-            history = CommandHistory(os.path.join(self.data_dir, 'history.json'))
-            
-            # Test command history
-            history.add_command('test command', 'main')
-            recent = history.get_recent_commands(5)
-            self.assertIsInstance(recent, list)
-            
-            # Test auto-completion
-            completions = history.get_auto_completions('test')
-            self.assertIsInstance(completions, list)
-            
-            print("Motor disability support working correctly")
-            
-        except ImportError:
-            print("Command history module not available, skipping motor disability test")
+        history = CommandHistory(os.path.join(self.data_dir, 'history.json'))
+        
+        # Test command history
+        history.add_command('test command', 'main')
+        recent = history.get_recent_commands(5)
+        self.assertIsInstance(recent, list)
+        
+        # Test auto-completion
+        completions = history.get_auto_completions('test')
+        self.assertIsInstance(completions, list)
+        
+        logger.debug("Motor disability support working correctly")
     
+    @unittest.skipUnless(_HAS_CONSOLE, "enhanced_console unavailable")
     def test_cognitive_disability_support(self):
         """Test cognitive disability support."""
-        print("\n=== Cognitive Disability Support Test ===")
+        logger.debug("=== Cognitive Disability Support Test ===")
         
-        try:
-            from ui.enhanced_console import EnhancedConsole
-            
-            console = EnhancedConsole(self.data_dir)
-            
-            # Test help system
-            help_info = console.get_context_help('main')
-            self.assertIsInstance(help_info, dict)
-            
-            # Test tutorials
-            console.run_tutorial('basic')
-            
-            print("Cognitive disability support working correctly")
-            
-        except ImportError:
-            print("Enhanced console module not available, skipping cognitive disability test")
+        console = EnhancedConsole(self.data_dir)
+        
+        # Test help system
+        help_info = console.get_context_help('main')
+        self.assertIsInstance(help_info, dict)
+        
+        # Test tutorials
+        console.run_tutorial('basic')
+        
+        logger.debug("Cognitive disability support working correctly")
     
+    @unittest.skipUnless(_HAS_CONSOLE, "enhanced_console unavailable")
     def test_hearing_disability_support(self):
         """Test hearing disability support."""
-        print("\n=== Hearing Disability Support Test ===")
+        logger.debug("=== Hearing Disability Support Test ===")
+        
+        console = EnhancedConsole(self.data_dir)
         
         # Test visual feedback
-        try:
-            from ui.enhanced_console import EnhancedConsole
-            
-            console = EnhancedConsole(self.data_dir)
-            
-            # Test visual feedback
-            console.display_breadcrumb()
-            
-            print("Hearing disability support working correctly")
-            
-        except ImportError:
-            print("Enhanced console module not available, skipping hearing disability test")
+        console.display_breadcrumb()
+        
+        logger.debug("Hearing disability support working correctly")
     
+    @unittest.skipUnless(_HAS_CONSOLE, "enhanced_console unavailable")
     def test_learning_disability_support(self):
         """Test learning disability support."""
-        print("\n=== Learning Disability Support Test ===")
+        logger.debug("=== Learning Disability Support Test ===")
         
-        try:
-            from ui.enhanced_console import EnhancedConsole
-            
-            console = EnhancedConsole(self.data_dir)
-            
-            # Test user onboarding
-            console.setup_user_onboarding()
-            
-            # Test help system
-            console.show_help('main')
-            
-            print("Learning disability support working correctly")
-            
-        except ImportError:
-            print("Enhanced console module not available, skipping learning disability test")
-
-
-class CrossPlatformTestSuite(unittest.TestCase):
-    """Cross-platform compatibility test suite."""
-    
-    def setUp(self):
-        """Set up cross-platform test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = os.path.join(self.temp_dir, 'data')
-        os.makedirs(self.data_dir, exist_ok=True)
-    
-    def tearDown(self):
-        """Clean up cross-platform test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_path_handling(self):
-        """Test cross-platform path handling."""
-        print("\n=== Cross-Platform Path Handling Test ===")
+        console = EnhancedConsole(self.data_dir)
         
-        # Test path operations
-        test_path = os.path.join(self.data_dir, 'test_file.txt')
+        # Test user onboarding
+        console.setup_user_onboarding()
         
-        # Create file
-        with open(test_path, 'w') as f:
-            f.write("test data")
+        # Test help system
+        console.show_help('main')
         
-        # Test file existence
-        self.assertTrue(os.path.exists(test_path))
-        
-        # Test path operations
-        path_obj = Path(test_path)
-        self.assertEqual(path_obj.name, 'test_file.txt')
-        self.assertEqual(path_obj.suffix, '.txt')
+        logger.debug("Learning disability support working correctly")
+
+
+class CrossPlatformTestSuite(_SandboxedTestCase):
+    """Cross-platform compatibility test suite."""
     
-    def test_file_operations(self):
-        """Test cross-platform file operations."""
-        print("\n=== Cross-Platform File Operations Test ===")
+    def test_cross_platform_io(self):
+        """Test cross-platform path handling and file operations on one file."""
+        logger.debug("=== Cross-Platform Path and File Operations Test ===")
         
         # Test file creation
-        test_file = os.path.join(self.data_dir, 'cross_platform_test.txt')
+        test_path = Path(self.data_dir) / 'cross_platform_test.txt'
+        test_path.write_text("Cross-platform test data", encoding='utf-8')
         
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write("Cross-platform test data")
+        # Test file existence and path operations
+        self.assertTrue(test_path.exists())
+        self.assertEqual(test_path.name, 'cross_platform_test.txt')
+        self.assertEqual(test_path.suffix, '.txt')
         
         # Test file reading
-        with open(test_file, 'r', encoding='utf-8') as f:
-            data = f.read()
-        
-        self.assertEqual(data, "Cross-platform test data")
+        self.assertEqual(test_path.read_text(encoding='utf-8'), "Cross-platform test data")
     
     def test_encoding_handling(self):
         """Test cross-platform encoding handling."""
-        print("\n=== Cross-Platform Encoding Test ===")
+        logger.debug("=== Cross-Platform Encoding Test ===")
         
         # Test different encodings
         encodings = ['utf-8', 'utf-16', 'latin-1']
         
         for encoding in encodings:
-            test_file = os.path.join(self.data_dir, f'test_{encoding}.txt')
+            test_file = Path(self.data_dir, f'test_{encoding}.txt')
             
             try:
-                with open(test_file, 'w', encoding=encoding) as f:
+                # Write and read back through one handle instead of reopening
+                with test_file.open('w+', encoding=encoding) as f:
                     f.write("Test data with encoding")
-                
-                with open(test_file, 'r', encoding=encoding) as f:
+                    f.seek(0)
                     data = f.read()
                 
                 self.assertEqual(data, "Test data with encoding")
             except UnicodeError:
-                print(f"Encoding {encoding} not supported on this platform")
+                logger.debug("Encoding %s not supported on this platform", encoding)
 
 
 if __name__ == '__main__':
-    # Set up logging
-    import logging
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
+    # Set up logging (raise to DEBUG to see per-test progress)
+    logging.basicConfig(level=logging.WARNING)
     
     # Run security and accessibility tests
     print("Starting Security and Accessibility Tests...")
@@ -9,73 +9,148 @@ when operations are combined or done in sequence.
 import sys
 import os
 import unittest
-import tempfile
+from functools import lru_cache
 from unittest.mock import patch
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from app_controller_db import AppControllerDB
 from question_manager_db import QuestionManagerDB
 from tag_manager_db import TagManagerDB
 from quiz_engine import QuizEngine
+from session_storage import MemoryStorage
 from database_manager import DatabaseManager
 
 
+class CachedQuestionManagerDB(QuestionManagerDB):
+    """QuestionManagerDB that memoizes tag queries until the next write."""
+    
+    def __init__(self, db_manager: DatabaseManager):
+        super().__init__(db_manager)
+        # Per-instance cache keyed by the sorted tag tuple
+        self._questions_by_tags = lru_cache(maxsize=64)(self._fetch_questions_by_tags)
+    
+    def _fetch_questions_by_tags(self, tags):
+        return super().get_questions_by_tags(list(tags))
+    
+    def get_questions_by_tags(self, tags):
+        # Copies, so callers editing a result cannot change the cached rows
+        return [dict(question) for question in self._questions_by_tags(tuple(sorted(tags)))]
+    
+    def invalidate(self):
+        """Drop cached tag queries after any write."""
+        self._questions_by_tags.cache_clear()
+    
+    def create_question(self, *args, **kwargs):
+        self.invalidate()
+        return super().create_question(*args, **kwargs)
+    
+    def create_questions_bulk(self, *args, **kwargs):
+        self.invalidate()
+        return super().create_questions_bulk(*args, **kwargs)
+    
+    def update_question(self, *args, **kwargs):
+        self.invalidate()
+        return super().update_question(*args, **kwargs)
+    
+    def delete_question(self, *args, **kwargs):
+        self.invalidate()
+        return super().delete_question(*args, **kwargs)
+
+
+class CachedTagManagerDB(TagManagerDB):
+    """TagManagerDB that drops the question cache when a tag changes."""
+    
+    def __init__(self, db_manager: DatabaseManager, question_manager: CachedQuestionManagerDB):
+        super().__init__(db_manager)
+        self._question_manager = question_manager
+    
+    def update_tag(self, *args, **kwargs):
+        self._question_manager.invalidate()
+        return super().update_tag(*args, **kwargs)
+    
+    def delete_tag(self, *args, **kwargs):
+        self._question_manager.invalidate()
+        return super().delete_tag(*args, **kwargs)
+    
+    def merge_tags(self, *args, **kwargs):
+        self._question_manager.invalidate()
+        return super().merge_tags(*args, **kwargs)
+
+
+# Questions seeded for the tag query scenarios: label -> (text, tags)
+_TAG_QUERY_QUESTIONS = {
+    'math_easy': ("What is 2+2?", ["Math", "Easy"]),
+    'history': ("History question?", ["History"]),
+    'science': ("Science question?", ["Science"]),
+    'count_1': ("Q1?", ["CountTest"]),
+    'count_2': ("Q2?", ["CountTest"]),
+    'single': ("Single question?", ["NoDupTest"]),
+}
+
+# Each scenario queries by tags and lists the seeded questions expected in
+# (exactly once) and out of the result
+_TAG_QUERY_SCENARIOS = (
+    {'tags': ["Math"], 'included': ['math_easy'], 'excluded': ['history', 'science']},
+    {'tags': ["Easy"], 'included': ['math_easy'], 'excluded': ['history', 'science']},
+    {'tags': ["Math", "Easy"], 'included': ['math_easy'], 'excluded': ['history', 'science']},
+    {'tags': ["History"], 'included': ['history'], 'excluded': ['science', 'math_easy']},
+    {'tags': ["CountTest"], 'included': ['count_1', 'count_2'], 'excluded': ['single'],
+     'count_tag': "CountTest"},
+    {'tags': ["NoDupTest"], 'included': ['single'], 'excluded': ['count_1', 'count_2']},
+)
+
+
 class TestWorkflowIntegrity(unittest.TestCase):
     """Test complete workflows for data integrity."""
     
-    def setUp(self):
-        """Set up test environment."""
-        # Use a temporary test database file
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        self.temp_db.close()
-        self.db_path = self.temp_db.name
-        
-        self.db_manager = DatabaseManager(self.db_path)
-        # Initialize database schema
-        if not self.db_manager.initialize():
+    @classmethod
+    def setUpClass(cls):
+        """Create the database, managers and controller once for the class."""
+        # The in-memory database is private to this process, so pytest-xdist
+        # workers (pytest -n auto) each get their own copy
+        cls.db_manager = DatabaseManager(in_memory=True, test_mode=True)
+        if not cls.db_manager.initialize():
             raise Exception("Failed to initialize database")
         
-        self.question_manager = QuestionManagerDB(self.db_manager)
-        self.tag_manager = TagManagerDB(self.db_manager)
-        
-        # Create temp directory for quiz sessions
-        self.temp_dir = tempfile.mkdtemp()
-        session_path = os.path.join(self.temp_dir, 'quiz_sessions.json')
-        self.quiz_engine = QuizEngine(session_storage_path=session_path)
-        
-        self.app = AppControllerDB()
-        # Replace with test database
-        self.app.db_manager = self.db_manager
-        self.app.question_manager = self.question_manager
-        self.app.tag_manager = self.tag_manager
-        self.app.quiz_engine = self.quiz_engine
+        # Pristine schema, copied back page by page after every test
+        cls.template = cls.db_manager.connection_manager.create_snapshot()
+        if cls.template is None:
+            raise Exception("Failed to snapshot database")
+        cls.addClassCleanup(cls.template.close)
+        
+        cls.question_manager = CachedQuestionManagerDB(cls.db_manager)
+        cls.tag_manager = CachedTagManagerDB(cls.db_manager, cls.question_manager)
+        
+        # Sessions and analytics live in memory, so the engine never touches disk
+        cls.quiz_engine = QuizEngine(storage_backend=MemoryStorage())
+        
+        # Build the controller around the test components; its defaults would
+        # open data/quiz.db and load data/quiz_sessions.json from the cwd
+        with patch('app_controller_db.DatabaseManager', return_value=cls.db_manager), \
+                patch('app_controller_db.QuestionManagerDB', return_value=cls.question_manager), \
+                patch('app_controller_db.TagManagerDB', return_value=cls.tag_manager), \
+                patch('app_controller_db.QuizEngine', return_value=cls.quiz_engine):
+            cls.app = AppControllerDB()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared in-memory database."""
+        cls.db_manager.close()
+    
+    def setUp(self):
+        """Start each test without sessions left over from the previous one."""
+        self.quiz_engine.active_sessions.clear()
         
     def tearDown(self):
         """Clean up after tests."""
-        if hasattr(self, 'db_manager'):
-            try:
-                self.db_manager.close()
-            except:
-                pass
-        if hasattr(self.app, 'db_manager'):
-            try:
-                self.app.db_manager.close()
-            except:
-                pass
-        # Clean up temp file
-        if hasattr(self, 'temp_db') and os.path.exists(self.temp_db.name):
-            try:
-                os.unlink(self.temp_db.name)
-            except:
-                pass
-        # Clean up temp directory
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            try:
-                import shutil
-                shutil.rmtree(self.temp_dir)
-            except:
-                pass
+        # Restore the pristine snapshot instead of rebuilding the schema; a failed
+        # restore would leave the next test running on this test's rows
+        self.assertTrue(self.db_manager.connection_manager.restore_snapshot(self.template),
+                        "Failed to restore database snapshot")
+        self.question_manager.invalidate()
     
     def test_create_take_quiz_workflow(self):
         """Test complete workflow: create question → take quiz → verify data."""
@@ -91,7 +166,7 @@ class TestWorkflowIntegrity(unittest.TestCase):
                 {"text": "5", "is_correct": False}
             ],
             [tag_name]
-        )
+        )['id']
         
         # Step 2: Verify question was created correctly
         stored = self.question_manager.get_question(question_id)
@@ -103,7 +178,7 @@ class TestWorkflowIntegrity(unittest.TestCase):
         questions = self.question_manager.get_questions_by_tags([tag_name])
         self.assertEqual(len(questions), 1, "Should find 1 question")
         
-        session_id = self.quiz_engine.start_session(questions)
+        session_id = self.quiz_engine.start_quiz(questions)
         session = self.quiz_engine.active_sessions.get(session_id)
         
         # Step 4: Verify quiz session has correct question
@@ -121,98 +196,6 @@ class TestWorkflowIntegrity(unittest.TestCase):
         self.assertTrue(result.get('is_correct', False),
                         "Correct answer should be marked correct")
     
-    def test_tag_question_count_consistency(self):
-        """Test that tag question counts stay consistent through workflow."""
-        tag_name = "CountTest"
-        tag_id = self.tag_manager.create_tag(tag_name)
-        
-        # Create 2 questions
-        q1_id = self.question_manager.create_question(
-            "Q1?", "multiple_choice",
-            [{"text": "A", "is_correct": True}, {"text": "B", "is_correct": False}],
-            [tag_name]
-        )
-        
-        q2_id = self.question_manager.create_question(
-            "Q2?", "multiple_choice",
-            [{"text": "A", "is_correct": True}, {"text": "B", "is_correct": False}],
-            [tag_name]
-        )
-        
-        # Verify tag count matches actual questions
-        tag = self.tag_manager.get_tag(tag_id)
-        tag_count = tag.get('question_count', 0)
-        
-        actual_questions = self.question_manager.get_questions_by_tags([tag_name])
-        actual_count = len(actual_questions)
-        
-        self.assertEqual(tag_count, actual_count,
-                        f"Tag count ({tag_count}) should match actual ({actual_count})")
-        
-        # Both questions should be found
-        q_ids = [q['id'] for q in actual_questions]
-        self.assertIn(q1_id, q_ids, "Q1 should be found")
-        self.assertIn(q2_id, q_ids, "Q2 should be found")
-    
-    def test_multiple_tags_question_appears_correctly(self):
-        """Test question with multiple tags appears in correct quizzes."""
-        tag1 = "Math"
-        tag2 = "Easy"
-        
-        tag1_id = self.tag_manager.create_tag(tag1)
-        tag2_id = self.tag_manager.create_tag(tag2)
-        
-        # Create question with both tags
-        q_id = self.question_manager.create_question(
-            "What is 2+2?", "multiple_choice",
-            [{"text": "4", "is_correct": True}, {"text": "5", "is_correct": False}],
-            [tag1, tag2]
-        )
-        
-        # Should appear in Math quiz
-        math_questions = self.question_manager.get_questions_by_tags([tag1])
-        math_q_ids = [q['id'] for q in math_questions]
-        self.assertIn(q_id, math_q_ids, "Should appear in Math quiz")
-        
-        # Should appear in Easy quiz
-        easy_questions = self.question_manager.get_questions_by_tags([tag2])
-        easy_q_ids = [q['id'] for q in easy_questions]
-        self.assertIn(q_id, easy_q_ids, "Should appear in Easy quiz")
-        
-        # Should appear in both tags quiz
-        both_questions = self.question_manager.get_questions_by_tags([tag1, tag2])
-        both_q_ids = [q['id'] for q in both_questions]
-        self.assertIn(q_id, both_q_ids, "Should appear in combined quiz")
-    
-    def test_quiz_doesnt_include_unselected_tags(self):
-        """Test that quiz for one tag doesn't include questions from other tags."""
-        tag1_id = self.tag_manager.create_tag("History")
-        tag2_id = self.tag_manager.create_tag("Science")
-        
-        # Create History question
-        h_q = self.question_manager.create_question(
-            "History question?", "multiple_choice",
-            [{"text": "A", "is_correct": True}, {"text": "B", "is_correct": False}],
-            ["History"]
-        )
-        
-        # Create Science question
-        s_q = self.question_manager.create_question(
-            "Science question?", "multiple_choice",
-            [{"text": "A", "is_correct": True}, {"text": "B", "is_correct": False}],
-            ["Science"]
-        )
-        
-        # Get History quiz
-        history_questions = self.question_manager.get_questions_by_tags(["History"])
-        history_q_ids = [q['id'] for q in history_questions]
-        
-        # Verify Science question NOT in History quiz
-        self.assertNotIn(s_q, history_q_ids,
-                        "Science question should NOT be in History quiz")
-        self.assertIn(h_q, history_q_ids,
-                   "History question should be in History quiz")
-    
     def test_answer_text_integrity_through_workflow(self):
         """Test that answer text doesn't change through create → quiz → score workflow."""
         original_answers = [
@@ -225,21 +208,20 @@ class TestWorkflowIntegrity(unittest.TestCase):
             "Pick the right one", "multiple_choice",
             original_answers,
             ["Test"]
-        )
+        )['id']
         
         # Retrieve from database
         stored = self.question_manager.get_question(question_id)
         stored_answers = stored.get('answers', [])
         
         # Verify answers match
-        for i, original in enumerate(original_answers):
-            stored_text = stored_answers[i].get('text', '')
-            self.assertEqual(stored_text, original['text'],
-                           f"Answer {i+1} text should match: '{stored_text}' != '{original['text']}'")
+        original_texts = [a['text'] for a in original_answers]
+        self.assertListEqual([a.get('text', '') for a in stored_answers[:len(original_texts)]],
+                             original_texts, "Stored answer texts should match")
         
         # Use in quiz
         questions = [stored]
-        session_id = self.quiz_engine.start_session(questions)
+        session_id = self.quiz_engine.start_quiz(questions)
         
         # Get question from session
         session = self.quiz_engine.active_sessions.get(session_id)
@@ -247,39 +229,39 @@ class TestWorkflowIntegrity(unittest.TestCase):
         session_answers = session_q.get('answers', [])
         
         # Verify answers still match in session
-        for i, original in enumerate(original_answers):
-            session_text = session_answers[i].get('text', '')
-            self.assertEqual(session_text, original['text'],
-                           f"Answer {i+1} in session should match: '{session_text}'")
+        self.assertListEqual([a.get('text', '') for a in session_answers[:len(original_texts)]],
+                             original_texts, "Session answer texts should match")
     
     def test_scoring_correctness_with_multiple_questions(self):
         """Test scoring is correct when quiz has multiple questions."""
-        # Create 4 questions
-        questions = []
-        for i in range(4):
-            q_id = self.question_manager.create_question(
-                f"Q{i+1}?", "multiple_choice",
-                [{"text": "Wrong", "is_correct": False},
-                 {"text": "Correct", "is_correct": True}],
-                ["Test"]
-            )
-            q = self.question_manager.get_question(q_id)
-            questions.append(q)
+        # Create 4 questions in one batch
+        created = self.question_manager.create_questions_bulk([
+            {
+                'question_text': f"Q{i+1}?",
+                'question_type': "multiple_choice",
+                'answers': [{"text": "Wrong", "is_correct": False},
+                            {"text": "Correct", "is_correct": True}],
+                'tags': ["Test"]
+            }
+            for i in range(4)
+        ])
+        questions = [self.question_manager.get_question(q['id']) for q in created]
         
         # Start quiz
-        session_id = self.quiz_engine.start_session(questions)
+        session_id = self.quiz_engine.start_quiz(questions)
+        
+        # First correct and first wrong answer index per question, found once
+        correct_idx_map = {q['id']: next(j for j, a in enumerate(q['answers']) if a['is_correct'])
+                           for q in questions}
+        wrong_idx_map = {q['id']: next(j for j, a in enumerate(q['answers']) if not a['is_correct'])
+                         for q in questions}
         
         # Answer 2 correct, 2 wrong
         for i, q in enumerate(questions):
-            answers = q.get('answers', [])
             if i < 2:  # First 2: answer correctly
-                correct_idx = next((j for j, a in enumerate(answers)
-                                  if a.get('is_correct', False)), None)
-                self.quiz_engine.submit_answer(session_id, q['id'], [correct_idx])
+                self.quiz_engine.submit_answer(session_id, q['id'], [correct_idx_map[q['id']]])
             else:  # Last 2: answer incorrectly
-                wrong_idx = next((j for j, a in enumerate(answers)
-                                if not a.get('is_correct', False)), None)
-                self.quiz_engine.submit_answer(session_id, q['id'], [wrong_idx])
+                self.quiz_engine.submit_answer(session_id, q['id'], [wrong_idx_map[q['id']]])
         
         # Check final score
         session = self.quiz_engine.active_sessions.get(session_id)
@@ -296,18 +278,20 @@ class TestWorkflowIntegrity(unittest.TestCase):
         tag_name = "StressTest"
         tag_id = self.tag_manager.create_tag(tag_name)
         
-        # Create multiple questions
-        question_ids = []
-        for i in range(5):
-            q_id = self.question_manager.create_question(
-                f"Stress test Q{i+1}?", "multiple_choice",
-                [
+        # Create multiple questions in one batch
+        created = self.question_manager.create_questions_bulk([
+            {
+                'question_text': f"Stress test Q{i+1}?",
+                'question_type': "multiple_choice",
+                'answers': [
                     {"text": f"Option A{i}", "is_correct": False},
                     {"text": f"Option B{i}", "is_correct": True}
                 ],
-                [tag_name]
-            )
-            question_ids.append(q_id)
+                'tags': [tag_name]
+            }
+            for i in range(5)
+        ])
+        question_ids = [q['id'] for q in created]
         
         # Verify all questions still correct
         for i, q_id in enumerate(question_ids):
@@ -333,37 +317,73 @@ class TestWorkflowIntegrity(unittest.TestCase):
             "Test question?", "multiple_choice",
             [{"text": "A", "is_correct": True}, {"text": "B", "is_correct": False}],
             [tag_name]
-        )
+        )['id']
         
-        # Retrieve multiple times
-        for _ in range(3):
-            stored = self.question_manager.get_question(q_id)
-            stored_tags = stored.get('tags', [])
-            self.assertIn(tag_name, stored_tags,
-                         "Tag should persist through retrievals")
+        # Retrieve once; repeated reads of unchanged rows add no signal
+        stored = self.question_manager.get_question(q_id)
+        self.assertIn(tag_name, stored.get('tags', []),
+                     "Tag should persist through retrieval")
     
-    def test_question_not_duplicated_in_quiz(self):
-        """Test that same question doesn't appear multiple times in quiz."""
-        tag_name = "NoDupTest"
-        tag_id = self.tag_manager.create_tag(tag_name)
-        
-        # Create question
+    def test_questions_by_tags_scenarios(self):
+        """Test tag queries return exactly the questions carrying those tags."""
+        two_answers = [{"text": "A", "is_correct": True}, {"text": "B", "is_correct": False}]
+        # Several questions share a tag, so collect names first; creating a
+        # tag twice returns None for the duplicate
+        tag_names = {tag_name for _, tags in _TAG_QUERY_QUESTIONS.values() for tag_name in tags}
+        tag_ids = {tag_name: self.tag_manager.create_tag(tag_name) for tag_name in tag_names}
+        
+        # Seed every scenario's questions once, then only query per sub-case
+        created_ids = {
+            label: self.question_manager.create_question(
+                text, "multiple_choice", two_answers, tags)['id']
+            for label, (text, tags) in _TAG_QUERY_QUESTIONS.items()
+        }
+        # AppControllerDB recalculates tag counts after creating questions
+        for tag_id in tag_ids.values():
+            self.tag_manager.recalculate_question_count(tag_id)
+        
+        for scenario in _TAG_QUERY_SCENARIOS:
+            with self.subTest(tags=scenario['tags']):
+                questions = self.question_manager.get_questions_by_tags(scenario['tags'])
+                q_ids = [q['id'] for q in questions]
+                
+                for label in scenario['included']:
+                    self.assertEqual(q_ids.count(created_ids[label]), 1,
+                                     f"{label} should appear exactly once")
+                for label in scenario['excluded']:
+                    self.assertNotIn(created_ids[label], q_ids,
+                                     f"{label} should not appear")
+                
+                if scenario.get('count_tag'):
+                    # Tag's stored count must match what the query returns
+                    tag = self.tag_manager.get_tag(tag_ids[scenario['count_tag']])
+                    tag_count = tag.get('question_count', 0)
+                    self.assertEqual(tag_count, len(q_ids),
+                                     f"Tag count ({tag_count}) should match actual ({len(q_ids)})")
+    
+    def test_cached_tag_query_follows_tag_writes(self):
+        """Test cached tag queries return copies and are dropped on tag writes."""
+        tag_id = self.tag_manager.create_tag("CacheTag")
         q_id = self.question_manager.create_question(
-            "Single question?", "multiple_choice",
+            "Cached question?", "multiple_choice",
             [{"text": "A", "is_correct": True}, {"text": "B", "is_correct": False}],
-            [tag_name]
-        )
-        
-        # Get questions for quiz
-        quiz_questions = self.question_manager.get_questions_by_tags([tag_name])
-        quiz_q_ids = [q['id'] for q in quiz_questions]
-        
-        # Count occurrences of our question
-        occurrences = quiz_q_ids.count(q_id)
-        self.assertEqual(occurrences, 1,
-                        f"Question should appear exactly once, found {occurrences} times")
+            ["CacheTag"]
+        )['id']
+        
+        first = self.question_manager.get_questions_by_tags(["CacheTag"])
+        first[0]['question_text'] = "edited by caller"
+        second = self.question_manager.get_questions_by_tags(["CacheTag"])
+        self.assertEqual([q['id'] for q in second], [q_id])
+        self.assertNotEqual(second[0]['question_text'], "edited by caller")
+        
+        # Tag renames and deletes go through the tag manager, which must drop the cache
+        cache = self.question_manager._questions_by_tags
+        self.assertTrue(self.tag_manager.update_tag(tag_id, name="CacheTagRenamed"))
+        self.assertEqual(cache.cache_info().currsize, 0)
+        self.question_manager.get_questions_by_tags(["CacheTag"])
+        self.assertTrue(self.tag_manager.delete_tag(tag_id))
+        self.assertEqual(cache.cache_info().currsize, 0)
 
 
 if __name__ == '__main__':
     unittest.main()
-
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Workflow Integrity Tests (mocked storage)
+
+Starts quizzes from a mocked question manager that returns fixed rows, so
+the checks cover what the quiz engine does with them without any SQL. Tag
+filtering and de-duplication belong to the manager and are covered by the
+database-backed tests in test_workflow_integrity.
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+
+_SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from question_manager_db import QuestionManagerDB
+from quiz_engine import QuizEngine
+from session_storage import MemoryStorage
+
+
+def _question(question_id, text, tags):
+    """Build a stored-question dict shaped like QuestionManagerDB's rows."""
+    return {
+        'id': question_id,
+        'question_text': text,
+        'question_type': 'multiple_choice',
+        'answers': [
+            {'text': 'Right', 'is_correct': True},
+            {'text': 'Wrong', 'is_correct': False}
+        ],
+        'tags': tags
+    }
+
+
+_MATH_EASY = _question('q-math-easy', 'What is 2+2?', ['Math', 'Easy'])
+_HISTORY = _question('q-history', 'History question?', ['History'])
+
+# Fixed manager result with one row repeated, as a join over several tags could return it
+_ROWS_WITH_DUPLICATE = (_MATH_EASY, _HISTORY, _MATH_EASY)
+
+
+class TestWorkflowIntegrityMocked(unittest.TestCase):
+    """Quiz membership workflows against a mocked question manager."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the quiz engine once, persisting to memory instead of disk."""
+        cls.quiz_engine = QuizEngine(storage_backend=MemoryStorage())
+    
+    def setUp(self):
+        """Give each test a fresh mocked manager and no leftover sessions."""
+        self.quiz_engine.active_sessions.clear()
+        self.question_manager = MagicMock(spec=QuestionManagerDB)
+    
+    def test_quiz_keeps_manager_rows_as_given(self):
+        """The engine neither filters nor de-duplicates the rows it is started with."""
+        self.question_manager.get_questions_by_tags.return_value = [dict(q) for q in _ROWS_WITH_DUPLICATE]
+        questions = self.question_manager.get_questions_by_tags(['Math', 'Easy', 'History'])
+        session_id = self.quiz_engine.start_quiz(questions)
+        
+        session = self.quiz_engine.active_sessions[session_id]
+        self.assertEqual([q['id'] for q in session['questions']],
+                         [q['id'] for q in _ROWS_WITH_DUPLICATE])
+        self.assertEqual(session['metadata']['question_count'], len(_ROWS_WITH_DUPLICATE))
+        self.assertEqual(sorted(session['metadata']['tags_used']), ['Easy', 'History', 'Math'])
+        self.assertIsNot(session['questions'][0], session['questions'][2])
+    
+    def test_session_snapshot_independent_of_manager_results(self):
+        """Editing returned question dicts does not change the started session."""
+        self.question_manager.get_questions_by_tags.return_value = [dict(_HISTORY)]
+        questions = self.question_manager.get_questions_by_tags(['History'])
+        session_id = self.quiz_engine.start_quiz(questions)
+        questions[0]['question_text'] = 'Edited afterwards'
+        
+        session = self.quiz_engine.active_sessions[session_id]
+        self.assertEqual(session['questions'][0]['question_text'], _HISTORY['question_text'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)